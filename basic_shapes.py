@@ -1,19 +1,30 @@
 from manim import *
 
-class BasicShapes(ThreeDScene):
+from geometry_cache import polyhedron_mesh
+from glyphs import GlyphCamera, SphereGlyphField
+from profiling import ProfiledSceneMixin
+from surfaces import PolyhedronMesh
+
+class BasicShapes(ProfiledSceneMixin, ThreeDScene):
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=GlyphCamera, **kwargs)
+    
     def construct(self):
         # Set camera
         self.set_camera_orientation(phi=75 * DEGREES, theta=30 * DEGREES)
         
         # Create just 8 spheres in a cube arrangement
-        spheres = VGroup()
-        for x in [-0.5, 0.5]:
-            for y in [-0.5, 0.5]:
-                for z in [-0.5, 0.5]:
-                    sphere = Sphere(radius=0.2)
-                    sphere.move_to([x, y, z])
-                    sphere.set_color(BLUE)
-                    spheres.add(sphere)
+        corners = [
+            [x, y, z]
+            for x in [-0.5, 0.5]
+            for y in [-0.5, 0.5]
+            for z in [-0.5, 0.5]
+        ]
+        spheres = SphereGlyphField(
+            corners,
+            radii=0.2,
+            colors=BLUE,
+        )
         
         # Show spheres
         self.add(spheres)
@@ -23,9 +34,8 @@ class BasicShapes(ThreeDScene):
         self.begin_ambient_camera_rotation(rate=0.2)
         self.wait(1)
         
-        # Create tetrahedron
-        tetrahedron = Tetrahedron()
-        tetrahedron.set_color(RED)
+        # Create tetrahedron from the cached mesh
+        tetrahedron = PolyhedronMesh(*polyhedron_mesh("tetrahedron"), color=RED)
         
         # Use FadeOut and FadeIn instead of Transform
         self.play(
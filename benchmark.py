@@ -0,0 +1,203 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# (script, scene) for every scene in the repo
+SCENES = [
+    ("basic_shapes.py", "BasicShapes"),
+    ("basic_morphing.py", "BasicMorphing"),
+    ("donut2sphere.py", "DonutToSphere"),
+    ("spheresinshapes.py", "ComplexFunctionVisualization"),
+    ("spheresinshapes.py", "CubeOfSpheres"),
+]
+
+# manim's quality presets, 480p15 up to 2160p60
+QUALITIES = ("l", "m", "h", "p", "k")
+
+# Metrics compared against the baseline, a run regresses when one grows by
+# more than the tolerance
+COMPARED_METRICS = ("wall_time", "peak_rss_bytes")
+
+MOVIE_SUFFIXES = (".mp4", ".mov", ".webm", ".gif")
+
+# First argument that makes this script render one scene and count its plays
+COUNT_PLAYS_COMMAND = "--count-plays"
+
+
+def count_frames(movie):
+    result = subprocess.run([
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-count_packets",
+        "-show_entries", "stream=nb_read_packets",
+        "-of", "csv=p=0",
+        str(movie),
+    ], capture_output=True, text=True)
+    try:
+        return int(result.stdout.strip())
+    except ValueError:
+        return None
+
+
+def find_movies(media_dir, scene_name):
+    # The final movie and the partial movie files of one render
+    movies = []
+    partial_movies = []
+    for path in Path(media_dir, "videos").rglob("*"):
+        if path.suffix not in MOVIE_SUFFIXES:
+            continue
+        if "partial_movie_files" in path.parts:
+            if scene_name in path.parts:
+                partial_movies.append(path)
+        elif path.stem == scene_name:
+            movies.append(path)
+    return movies, partial_movies
+
+
+def render_counting_plays(plays_file, manim_args):
+    # Run manim's command line in this process and write the number of
+    # play()/wait() calls the renderer got once the scene is done, whether
+    # it was cached, skipped or streamed
+    from manim import Scene
+    from manim.__main__ import main as manim_main
+
+    render = Scene.render
+
+    def render_and_count(scene, *args, **kwargs):
+        try:
+            return render(scene, *args, **kwargs)
+        finally:
+            Path(plays_file).write_text(str(scene.renderer.num_plays))
+
+    Scene.render = render_and_count
+    return manim_main(args=manim_args, prog_name="manim")
+
+
+def run_benchmark(script, scene_name, quality, extra_args=()):
+    # Render once into an empty media directory, so every run starts cold
+    with tempfile.TemporaryDirectory(prefix="manim-benchmark-") as media_dir:
+        plays_file = Path(media_dir, "plays.txt")
+        command = [
+            sys.executable, str(Path(__file__).resolve()),
+            COUNT_PLAYS_COMMAND, str(plays_file),
+            "render",
+            f"-q{quality}",
+            "--media_dir", media_dir,
+            *extra_args,
+            str(script), scene_name,
+        ]
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(process.pid, 0)
+        wall_time = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        plays = int(plays_file.read_text()) if plays_file.exists() else None
+
+        movies, partial_movies = find_movies(media_dir, scene_name)
+        frames = count_frames(movies[0]) if movies else None
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS. It covers the
+    # manim process, not the ffmpeg processes it starts
+    peak_rss = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return {
+        "script": Path(script).name,
+        "scene": scene_name,
+        "quality": quality,
+        "returncode": process.returncode,
+        "wall_time": wall_time,
+        "frames": frames,
+        "fps": frames / wall_time if frames else None,
+        "peak_rss_bytes": peak_rss,
+        "plays": plays,
+        "partial_movies": len(partial_movies),
+    }
+
+
+def get_environment():
+    try:
+        from importlib.metadata import version
+        manim_version = version("manim")
+    except Exception:
+        manim_version = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "manim": manim_version,
+    }
+
+
+def compare_to_baseline(report, baseline, tolerance):
+    # Runs of the same scene and quality whose metrics grew by more than
+    # tolerance (a fraction), or that failed where the baseline passed
+    baseline_runs = {(run["scene"], run["quality"]): run for run in baseline["runs"]}
+    regressions = []
+    for run in report["runs"]:
+        reference = baseline_runs.get((run["scene"], run["quality"]))
+        if reference is None:
+            continue
+        if run["returncode"] != 0 and reference["returncode"] == 0:
+            regressions.append((run["scene"], run["quality"], "returncode", reference["returncode"], run["returncode"]))
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = reference.get(metric), run.get(metric)
+            if old and new and new > old * (1 + tolerance):
+                regressions.append((run["scene"], run["quality"], metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rendering every scene in the repo")
+    parser.add_argument("-s", "--scene", action="append", help="only these scenes (repeatable)")
+    parser.add_argument("-q", "--quality", action="append", choices=QUALITIES, help="only these presets (repeatable)")
+    parser.add_argument("-o", "--output", default="benchmarks/report.json")
+    parser.add_argument("--baseline", default="benchmarks/baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="store this report as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed growth before a regression, default 0.15")
+    args, extra_args = parser.parse_known_args()
+
+    root = Path(__file__).resolve().parent
+    runs = []
+    for script, scene_name in SCENES:
+        if args.scene and scene_name not in args.scene:
+            continue
+        for quality in args.quality or QUALITIES:
+            run = run_benchmark(root / script, scene_name, quality, extra_args)
+            runs.append(run)
+            print(
+                f"{scene_name:<30} -q{quality}  {run['wall_time']:8.1f}s  "
+                f"{run['fps'] or 0:7.1f} fps  {run['peak_rss_bytes'] / 1024 ** 2:7.0f} MiB  "
+                f"{run['plays'] or 0:4d} plays  {run['partial_movies']:4d} partials"
+                + ("" if run["returncode"] == 0 else f"  FAILED ({run['returncode']})")
+            )
+
+    report = {"environment": get_environment(), "runs": runs}
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    baseline = Path(args.baseline)
+    if args.save_baseline:
+        baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline.write_text(json.dumps(report, indent=2))
+        return 0
+    if not baseline.exists():
+        return 0
+    regressions = compare_to_baseline(report, json.loads(baseline.read_text()), args.tolerance)
+    for scene_name, quality, metric, old, new in regressions:
+        print(f"REGRESSION {scene_name} -q{quality}: {metric} {old:.6g} -> {new:.6g}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == [COUNT_PLAYS_COMMAND]:
+        sys.exit(render_counting_plays(sys.argv[2], sys.argv[3:]))
+    else:
+        sys.exit(main())
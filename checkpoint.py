@@ -0,0 +1,191 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from manim import *
+
+from parallel_render import concatenate_movies
+from render_cache import update_with_mobject
+from streaming import StreamingFileWriter
+
+# Set to 1 to checkpoint into <media_dir>/checkpoints, or to a directory
+CHECKPOINT_ENV = "MANIM_CHECKPOINT"
+
+MANIFEST_NAME = "manifest.json"
+
+
+class CheckpointManifest:
+    # manifest.json of one scene at one output size: a hash of the sources and
+    # settings, and per finished section the state it started from and its
+    # movie segment. Rewritten atomically after every section
+    def __init__(self, directory, source_hash):
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_NAME
+        self.source_hash = source_hash
+        self.sections = {}
+        try:
+            manifest = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if manifest.get("source") == source_hash:
+            self.sections = manifest["sections"]
+        else:
+            logger.info(f"Sources changed since the checkpoints in {self.directory}, starting over")
+
+    def is_complete(self, name, start_state):
+        section = self.sections.get(name)
+        return section is not None and section["start_state"] == start_state
+
+    def add_section(self, name, start_state, state, movies):
+        # movies are this section's segments in order, joined into one file
+        self.directory.mkdir(parents=True, exist_ok=True)
+        movie = None
+        if movies:
+            movie = f"{name}{Path(movies[0]).suffix}"
+            if len(movies) == 1:
+                shutil.copyfile(movies[0], self.directory / movie)
+            else:
+                concatenate_movies(movies, self.directory / movie)
+        self.sections[name] = {"start_state": start_state, "state": state, "movie": movie}
+        self.save()
+
+    def get_movie(self, name):
+        movie = self.sections[name]["movie"]
+        return movie and self.directory / movie
+
+    def save(self):
+        handle, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".json")
+        with os.fdopen(handle, "w") as file:
+            json.dump({"source": self.source_hash, "sections": self.sections}, file, indent=2)
+        os.replace(temporary_path, self.path)
+
+
+class CheckpointSceneMixin:
+    # Saves every finished section's movie segment and the state it started
+    # from when CHECKPOINT_ENV is set. A restarted render runs the sections
+    # that are already done with skip_animations, as long as the sources and
+    # the state at their start (mobjects, camera, get_checkpoint_state) are
+    # unchanged, and joins the saved segments into the final movie. Mix in
+    # before the Scene class
+    checkpoints = None
+
+    def get_checkpoint_directory(self):
+        setting = os.environ[CHECKPOINT_ENV]
+        root = Path(config.media_dir, "checkpoints") if setting in ("1", "true") else Path(setting)
+        quality = f"{config.pixel_height}p{config.frame_rate:g}"
+        return root / type(self).__name__ / quality
+
+    def get_source_hash(self):
+        # Every module next to the scene's script, plus the output settings
+        hasher = hashlib.sha256()
+        script_directory = Path(inspect.getsourcefile(type(self))).resolve().parent
+        for path in sorted(script_directory.glob("*.py")):
+            hasher.update(path.name.encode())
+            hasher.update(path.read_bytes())
+        hasher.update(repr((
+            config.pixel_width,
+            config.pixel_height,
+            config.frame_rate,
+            config.format,
+            config.transparent,
+            str(config.background_color),
+            getattr(self, "is_draft", lambda: False)(),
+        )).encode())
+        return hasher.hexdigest()
+
+    def get_checkpoint_state(self):
+        # Readable part of the state at a section boundary, stored in the
+        # manifest. Scenes add their own values, e.g. computed results
+        camera = self.renderer.camera
+        state = {}
+        if isinstance(camera, ThreeDCamera):
+            state["camera"] = {
+                "phi": camera.get_phi(),
+                "theta": camera.get_theta(),
+                "gamma": camera.get_gamma(),
+                "zoom": camera.get_zoom(),
+                "focal_distance": camera.get_focal_distance(),
+                "frame_center": [float(value) for value in camera.frame_center],
+            }
+        return state
+
+    def get_state_digest(self, state):
+        hasher = hashlib.sha256(json.dumps(state, sort_keys=True).encode())
+        for mobject in self.mobjects:
+            update_with_mobject(hasher, mobject)
+        return hasher.hexdigest()
+
+    def render(self, preview=False):
+        if not os.environ.get(CHECKPOINT_ENV):
+            return super().render(preview)
+        self.checkpoints = CheckpointManifest(self.get_checkpoint_directory(), self.get_source_hash())
+        self.checkpoint_names = []
+        self.checkpoint_section = None
+        return super().render(preview)
+
+    def next_section(self, name="unnamed", *args, skip_animations=False, **kwargs):
+        if self.checkpoints is None:
+            return super().next_section(name, *args, skip_animations=skip_animations, **kwargs)
+        self.finish_checkpoint_section()
+        state = self.get_checkpoint_state()
+        start_state = self.get_state_digest(state)
+        resumed = self.checkpoints.is_complete(name, start_state)
+        if resumed:
+            logger.info(f"Section {name!r} is checkpointed, skipping it")
+        super().next_section(name, *args, skip_animations=skip_animations or resumed, **kwargs)
+
+        file_writer = self.renderer.file_writer
+        self.checkpoint_names.append(name)
+        self.checkpoint_section = {
+            "name": name,
+            "start_state": start_state,
+            "resumed": resumed,
+            "first_stream": len(getattr(file_writer, "stream_files", ())),
+        }
+
+    def finish_checkpoint_section(self):
+        # Save the segment of the section that is running, if it rendered one
+        section = self.checkpoint_section
+        self.checkpoint_section = None
+        if section is None or section["resumed"] or self.renderer.file_writer.sections[-1].skip_animations:
+            return
+        file_writer = self.renderer.file_writer
+        if isinstance(file_writer, StreamingFileWriter) and file_writer.is_streaming():
+            file_writer.close_stream()
+            movies = file_writer.stream_files[section["first_stream"]:]
+        else:
+            movies = [movie for movie in file_writer.sections[-1].partial_movie_files if movie]
+        self.checkpoints.add_section(
+            section["name"], section["start_state"], self.get_checkpoint_state(), movies
+        )
+
+    def tear_down(self):
+        if self.checkpoints is not None:
+            self.finish_checkpoint_section()
+            # The file writer finishes right after tear_down and before the
+            # preview opens, joining the segments is its last step
+            file_writer = self.renderer.file_writer
+            finish = file_writer.finish
+
+            def finish_and_join():
+                finish()
+                self.join_checkpoints()
+
+            file_writer.finish = finish_and_join
+        super().tear_down()
+
+    def join_checkpoints(self):
+        # The file writer only saw the sections rendered this time, so the
+        # movie is rebuilt from the segments of every section
+        if not config.write_to_movie or not self.checkpoint_names:
+            return
+        if not all(name in self.checkpoints.sections for name in self.checkpoint_names):
+            return
+        movies = [self.checkpoints.get_movie(name) for name in self.checkpoint_names]
+        movies = [movie for movie in movies if movie]
+        if movies:
+            concatenate_movies(movies, self.renderer.file_writer.movie_file_path)
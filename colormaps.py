@@ -0,0 +1,97 @@
+import numpy as np
+
+# manim is only imported by the helpers that convert to and from its colors,
+# so the sampling and integration engines built on this module run without it
+
+
+def hsl_to_rgb(hue, saturation, lightness):
+    # Vectorized version of the HSL -> RGB conversion used by colour.Color(hsl=...)
+    # Works on scalars or arrays, returns an array with a trailing RGB axis
+    hue = np.asarray(hue, dtype=float)
+    saturation = np.broadcast_to(np.asarray(saturation, dtype=float), hue.shape)
+    lightness = np.broadcast_to(np.asarray(lightness, dtype=float), hue.shape)
+
+    v2 = np.where(
+        lightness < 0.5,
+        lightness * (1 + saturation),
+        (lightness + saturation) - saturation * lightness,
+    )
+    v1 = 2 * lightness - v2
+
+    def hue_to_channel(h):
+        h = np.mod(h, 1.0)
+        return np.select(
+            [6 * h < 1, 2 * h < 1, 3 * h < 2],
+            [v1 + (v2 - v1) * 6 * h, v2, v1 + (v2 - v1) * (2 / 3 - h) * 6],
+            default=v1,
+        )
+
+    rgb = np.stack([
+        hue_to_channel(hue + 1 / 3),
+        hue_to_channel(hue),
+        hue_to_channel(hue - 1 / 3),
+    ], axis=-1)
+
+    # Zero saturation means a plain grey
+    grey = (saturation == 0)[..., None]
+    return np.where(grey, lightness[..., None], rgb)
+
+
+def phase_to_rgb(phase, saturation=0.8, lightness=0.6):
+    # Map phase from [-π, π] to [0, 1] for hue, same as phase_to_color in the scenes
+    hue = (np.asarray(phase, dtype=float) + np.pi) / (2 * np.pi)
+    return hsl_to_rgb(hue, saturation, lightness)
+
+
+class PhaseColormap:
+    # Hue lookup table over phase in [-π, π]. Colors whole phase arrays with a
+    # single table lookup instead of an HSL conversion per sample
+    def __init__(self, resolution=1024, saturation=0.8, lightness=0.6):
+        self.resolution = resolution
+        self.saturation = saturation
+        self.lightness = lightness
+        # Bin i holds the color of hue i / resolution
+        self.table = phase_to_rgb(
+            np.arange(resolution) / resolution * 2 * np.pi - np.pi,
+            saturation,
+            lightness,
+        )
+
+    def get_rgb(self, phase):
+        # (..., 3) colors of the nearest bins, NaN where the phase is NaN
+        phase = np.asarray(phase, dtype=float)
+        finite = np.isfinite(phase)
+        hue = (np.where(finite, phase, 0.0) + np.pi) / (2 * np.pi)
+        index = np.rint(hue * self.resolution).astype(np.int64) % self.resolution
+        rgb = self.table[index]
+        rgb[~finite] = np.nan
+        return rgb
+
+    def __call__(self, phase, opacity=1.0):
+        # (..., 4) RGBA colors
+        rgb = self.get_rgb(phase)
+        alpha = np.broadcast_to(np.asarray(opacity, dtype=float), rgb.shape[:-1])
+        return np.concatenate([rgb, alpha[..., None]], axis=-1)
+
+    def get_colors(self, phases):
+        # Manim colors, for mobjects that take one color each
+        from manim import rgb_to_color
+
+        return [rgb_to_color(rgb) for rgb in self.get_rgb(phases)]
+
+
+# Shared by the complex samples, the surfaces and the legend
+PHASE_COLORMAP = PhaseColormap()
+
+
+def to_rgb_array(colors, count):
+    # Accept a single color, a list of colors or an (n, 3)/(n, 4) RGB(A) array
+    # and return an (count, 3) float array
+    from manim import color_to_rgb
+
+    if isinstance(colors, np.ndarray) and colors.dtype.kind == "f":
+        rgbs = colors.reshape(-1, colors.shape[-1])[:, :3]
+        return np.broadcast_to(rgbs, (count, 3)).copy()
+    if isinstance(colors, (list, tuple, np.ndarray)):
+        return np.array([color_to_rgb(color) for color in colors], dtype=float).reshape(count, 3)
+    return np.tile(color_to_rgb(colors), (count, 1))
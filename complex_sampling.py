@@ -0,0 +1,242 @@
+import heapq
+from collections import namedtuple
+
+import numpy as np
+
+from colormaps import PHASE_COLORMAP
+
+# Result of sampling a complex function over a grid. Every field is an array
+# shaped like the grid (colors has an extra RGB axis); invalid points are NaN
+ComplexGridSample = namedtuple(
+    "ComplexGridSample",
+    ["x", "y", "values", "magnitude", "phase", "valid", "colors"],
+)
+
+def evaluate_complex(func, z):
+    # Evaluate func on a whole complex array in one call. Functions written for
+    # scalars only (e.g. with an `if z != 0` guard) fall back to a point loop
+    z = np.asarray(z, dtype=complex)
+    with np.errstate(all="ignore"):
+        try:
+            w = np.asarray(func(z), dtype=complex)
+            if w.shape == z.shape:
+                return w
+            if w.ndim == 0:
+                # Constant function
+                return np.full(z.shape, complex(w))
+        except (TypeError, ValueError, ArithmeticError):
+            pass
+    return _evaluate_pointwise(func, z)
+
+
+def _evaluate_pointwise(func, z):
+    w = np.empty(z.size, dtype=complex)
+    for i, z_i in enumerate(z.flat):
+        try:
+            w[i] = complex(func(complex(z_i)))
+        except (TypeError, ValueError, ArithmeticError):
+            w[i] = complex(np.nan, np.nan)
+    return w.reshape(z.shape)
+
+
+def _get_sample_fields(values, max_magnitude):
+    # Mask infinities and NaNs, then cap extremely large values
+    valid = np.isfinite(values)
+    with np.errstate(all="ignore"):
+        magnitude = np.where(valid, np.minimum(np.abs(values), max_magnitude), np.nan)
+        phase = np.where(valid, np.angle(values), np.nan)
+    colors = PHASE_COLORMAP.get_rgb(phase)
+    return valid, magnitude, phase, colors
+
+
+def sample_complex_grid(func, x_values, y_values, max_magnitude=5):
+    # Sample func on the meshgrid of x_values × y_values. Rows follow x and
+    # columns follow y, matching the order the scenes iterate in
+    x, y = np.meshgrid(
+        np.asarray(x_values, dtype=float),
+        np.asarray(y_values, dtype=float),
+        indexing="ij",
+    )
+    values = evaluate_complex(func, x + 1j * y)
+    valid, magnitude, phase, colors = _get_sample_fields(values, max_magnitude)
+    return ComplexGridSample(x, y, values, magnitude, phase, valid, colors)
+
+
+# Result of adaptive sampling. x, y, values, magnitude, phase, valid and
+# cell_size have one entry per vertex (colors an extra RGB axis), faces holds
+# vertex indices of the quadtree cells that touch no invalid vertex. Cells
+# next to smaller ones carry the hanging midpoints of their edges, so faces
+# have up to 8 corners; shorter ones repeat their last corner
+ComplexMeshSample = namedtuple(
+    "ComplexMeshSample",
+    ["x", "y", "values", "magnitude", "phase", "valid", "colors", "faces", "cell_size"],
+)
+
+
+class _Quadtree:
+    # Cells live on an integer lattice with one unit per finest cell, so every
+    # vertex has exact coordinates and is evaluated only once
+    def __init__(self, func, x_range, y_range, initial_cells, max_depth):
+        self.func = func
+        self.finest = 2 ** max_depth
+        self.size = initial_cells * self.finest
+        self.origin = np.array([x_range[0], y_range[0]], dtype=float)
+        self.step = np.array([
+            (x_range[1] - x_range[0]) / self.size,
+            (y_range[1] - y_range[0]) / self.size,
+        ])
+        self.vertex_index = {}
+        self.lattice = []
+        self.values = np.empty(0, dtype=complex)
+        # (i, j) of the lower left corner -> edge length in lattice units
+        self.cells = {}
+
+    def get_initial_lattice(self):
+        # Lattice coordinates of the initial grid lines, the same along both axes
+        return np.arange(0, self.size + 1, self.finest)
+
+    def add_grid(self, grid):
+        # Corners of the initial cells, sampled as one grid
+        lattice = self.get_initial_lattice().tolist()
+        self._store_vertices([(i, j) for i in lattice for j in lattice], grid.values.ravel())
+
+    def add_vertices(self, keys):
+        # Evaluate all new lattice points of a batch in one call
+        new_keys = [key for key in dict.fromkeys(keys) if key not in self.vertex_index]
+        if not new_keys:
+            return
+        xy = self.origin + np.array(new_keys, dtype=float) * self.step
+        self._store_vertices(new_keys, evaluate_complex(self.func, xy[:, 0] + 1j * xy[:, 1]))
+
+    def _store_vertices(self, keys, values):
+        for key in keys:
+            self.vertex_index[key] = len(self.lattice)
+            self.lattice.append(key)
+        self.values = np.concatenate([self.values, values])
+
+    def get_corner_keys(self, cell):
+        i, j = cell
+        size = self.cells[cell]
+        return [(i, j), (i + size, j), (i + size, j + size), (i, j + size)]
+
+    def find_cell(self, i, j):
+        # Leaf containing lattice point (i, j), None outside the domain
+        if not (0 <= i < self.size and 0 <= j < self.size):
+            return None
+        size = self.finest
+        while size >= 1:
+            cell = (i - i % size, j - j % size)
+            if self.cells.get(cell) == size:
+                return cell
+            size //= 2
+        return None
+
+    def split(self, cell):
+        # Split a leaf into four, splitting larger neighbours first so
+        # neighbouring cells never differ by more than one level. Returns
+        # every new leaf, including the ones of split neighbours
+        i, j = cell
+        size = self.cells[cell]
+        new_cells = []
+        for neighbour_point in ((i - 1, j), (i + size, j), (i, j - 1), (i, j + size)):
+            neighbour = self.find_cell(*neighbour_point)
+            if neighbour is not None and self.cells[neighbour] > size:
+                new_cells += self.split(neighbour)
+
+        half = size // 2
+        del self.cells[cell]
+        children = [(i, j), (i + half, j), (i, j + half), (i + half, j + half)]
+        for child in children:
+            self.cells[child] = half
+        self.add_vertices([key for child in children for key in self.get_corner_keys(child)])
+        return [new_cell for new_cell in new_cells if new_cell in self.cells] + children
+
+    def get_polygon(self, cell):
+        # Corners in grid_to_quads order, with the hanging midpoints of edges
+        # shared with smaller cells
+        corners = self.get_corner_keys(cell)
+        half = self.cells[cell] // 2
+        polygon = []
+        for start, end in zip(corners, corners[1:] + corners[:1]):
+            polygon.append(self.vertex_index[start])
+            if half:
+                midpoint = ((start[0] + end[0]) // 2, (start[1] + end[1]) // 2)
+                if midpoint in self.vertex_index:
+                    polygon.append(self.vertex_index[midpoint])
+        return polygon
+
+
+def _get_cell_error(values, max_magnitude, magnitude_tolerance, phase_tolerance):
+    # How far the corners of a cell disagree, in units of the tolerances.
+    # Cells touching a non-finite value always want refinement
+    if not np.isfinite(values).all():
+        return np.inf
+    magnitude = np.minimum(np.abs(values), max_magnitude)
+    magnitude_error = (magnitude.max() - magnitude.min()) / magnitude_tolerance
+    # Largest phase difference between neighbouring corners, wrapped to [0, π]
+    phase = np.angle(values)
+    phase_jumps = np.abs(np.angle(np.exp(1j * (phase - np.roll(phase, 1)))))
+    return max(magnitude_error, phase_jumps.max() / phase_tolerance)
+
+
+def sample_complex_adaptive(
+    func,
+    x_range=(-3, 3),
+    y_range=(-3, 3),
+    initial_cells=8,
+    max_samples=576,
+    max_depth=4,
+    magnitude_tolerance=0.25,
+    phase_tolerance=np.pi / 4,
+    max_magnitude=5,
+):
+    # Start from an initial_cells × initial_cells grid and keep splitting the
+    # cell whose |f| (capped at max_magnitude) or phase varies most across its
+    # corners, or that touches a non-finite value, until no cell is over the
+    # tolerances, cells are max_depth levels deep or max_samples evaluations
+    # are spent. Poles and branch cuts get small cells, flat regions stay coarse
+    tree = _Quadtree(func, x_range, y_range, initial_cells, max_depth)
+    lattice = tree.get_initial_lattice()
+    tree.add_grid(sample_complex_grid(
+        func,
+        tree.origin[0] + lattice * tree.step[0],
+        tree.origin[1] + lattice * tree.step[1],
+        max_magnitude,
+    ))
+    for i in lattice[:-1].tolist():
+        for j in lattice[:-1].tolist():
+            tree.cells[(i, j)] = tree.finest
+
+    def get_error(cell):
+        corners = [tree.vertex_index[key] for key in tree.get_corner_keys(cell)]
+        return _get_cell_error(tree.values[corners], max_magnitude, magnitude_tolerance, phase_tolerance)
+
+    # Worst cell first; entries of cells that were split in the meantime
+    # (by a neighbour's balancing) are skipped when they come up
+    queue = [(-get_error(cell), cell, tree.finest) for cell in tree.cells]
+    heapq.heapify(queue)
+    while queue and len(tree.lattice) < max_samples:
+        error, cell, size = heapq.heappop(queue)
+        if -error <= 1:
+            break
+        if tree.cells.get(cell) != size or size == 1:
+            continue
+        for new_cell in tree.split(cell):
+            heapq.heappush(queue, (-get_error(new_cell), new_cell, tree.cells[new_cell]))
+
+    polygons = [tree.get_polygon(cell) for cell in tree.cells]
+    num_corners = max(len(polygon) for polygon in polygons)
+    faces = np.array([polygon + polygon[-1:] * (num_corners - len(polygon)) for polygon in polygons])
+
+    lattice = np.array(tree.lattice, dtype=float)
+    x, y = (tree.origin + lattice * tree.step).T
+    values = tree.values
+    valid, magnitude, phase, colors = _get_sample_fields(values, max_magnitude)
+
+    # Edge length of the smallest cell at every vertex, e.g. to size markers
+    cell_size = np.full(len(values), np.inf)
+    cell_sizes = np.array([tree.cells[cell] for cell in tree.cells], dtype=float) * tree.step.min()
+    np.minimum.at(cell_size, faces, cell_sizes[:, None])
+
+    faces = faces[valid[faces].all(axis=1)]
+    return ComplexMeshSample(x, y, values, magnitude, phase, valid, colors, faces, cell_size)
@@ -1,11 +1,18 @@
 from manim import *
 
-class DonutToSphere(ThreeDScene):
+from morphing import Morph, get_morph_resolution, sphere_morph_mesh, torus_morph_mesh
+from profiling import ProfiledSceneMixin
+from surfaces import MeshSurface
+
+class DonutToSphere(ProfiledSceneMixin, ThreeDScene):
     def construct(self):
-        donut = Torus(major_radius=2, minor_radius=1, fill_opacity=0.5, color=BLUE)
-        sphere = Sphere(radius=2, fill_opacity=0.5, color=RED)
+        # Donut and sphere share one spherical grid, so every vertex of the
+        # donut has a matching vertex on the sphere to morph to
+        resolution = get_morph_resolution(3)
+        donut = MeshSurface.from_mesh(*torus_morph_mesh(2, 1, resolution), colors=BLUE, fill_opacity=0.5)
+        sphere = sphere_morph_mesh(2, resolution)
         self.set_camera_orientation(phi=75 * DEGREES, theta =- 45 * DEGREES)
         self.play(Create(donut))
         self.wait()
-        self.play(Transform(donut, sphere))
+        self.play(Morph(donut, sphere, target_colors=RED))
         self.wait()
\ No newline at end of file
@@ -0,0 +1,83 @@
+import os
+
+from manim import *
+
+# Set to 1 to render every scene with DraftSceneMixin as a draft
+DRAFT_ENV = "MANIM_DRAFT"
+
+# Seconds every wait() and camera keyframe is held for in a draft
+DRAFT_WAIT_TIME = 0.1
+
+# Narrative animations that become an instant add or remove on text
+DRAFT_INTRODUCERS = (Write, AddTextLetterByLetter, FadeIn)
+DRAFT_REMOVERS = (Unwrite, FadeOut)
+
+TEXT_TYPES = (Text, MarkupText, Paragraph, SingleStringMathTex, DecimalNumber)
+
+
+def is_text(mobject):
+    # Text mobjects, and groups made of nothing else
+    if isinstance(mobject, TEXT_TYPES):
+        return True
+    return type(mobject) in (Group, VGroup) and bool(mobject.submobjects) and all(
+        is_text(submobject) for submobject in mobject.submobjects
+    )
+
+
+class DraftSceneMixin:
+    # Quick geometry check of a whole scene. Text that would be written or
+    # faded in or out just appears or disappears, waits are cut to
+    # DRAFT_WAIT_TIME and camera moves jump straight to their end, held for
+    # one short keyframe. Everything else plays as usual. Turn it on with
+    # draft = True on the scene or with DRAFT_ENV. Mix in before the Scene class
+    draft = False
+
+    def is_draft(self):
+        return self.draft or bool(os.environ.get(DRAFT_ENV))
+
+    def play(self, *animations, **kwargs):
+        if not self.is_draft():
+            return super().play(*animations, **kwargs)
+        remaining = []
+        for animation in animations:
+            if isinstance(animation, DRAFT_INTRODUCERS) and is_text(animation.mobject):
+                self.add(animation.mobject)
+            elif isinstance(animation, DRAFT_REMOVERS) and is_text(animation.mobject):
+                self.remove(animation.mobject)
+            else:
+                remaining.append(animation)
+        if remaining:
+            return super().play(*remaining, **kwargs)
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, *args, **kwargs):
+        if self.is_draft():
+            duration = min(duration, DRAFT_WAIT_TIME)
+        return super().wait(duration, *args, **kwargs)
+
+    def move_camera(
+        self,
+        phi=None,
+        theta=None,
+        gamma=None,
+        zoom=None,
+        focal_distance=None,
+        frame_center=None,
+        added_anims=[],
+        **kwargs
+    ):
+        if not self.is_draft():
+            return super().move_camera(
+                phi, theta, gamma, zoom, focal_distance, frame_center, added_anims, **kwargs
+            )
+        self.set_camera_orientation(
+            phi=phi,
+            theta=theta,
+            gamma=gamma,
+            zoom=zoom,
+            focal_distance=focal_distance,
+            frame_center=frame_center,
+        )
+        if added_anims:
+            self.play(*added_anims, **kwargs)
+        else:
+            self.wait(DRAFT_WAIT_TIME)
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import tempfile
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+from manim import Dodecahedron, Icosahedron, Octahedron, Tetrahedron
+
+from lod import get_sphere_resolution, get_torus_resolution
+from meshes import grid_face_indices
+
+# Directory the meshes are stored in, shared by every render and worker
+GEOMETRY_CACHE_ENV = "MANIM_GEOMETRY_CACHE"
+DEFAULT_GEOMETRY_DIRECTORY = Path(__file__).resolve().parent / "media" / "geometry"
+
+# Part of every mesh key, bump it when the stored format changes. The sources
+# of the builders and manim's version (for the polyhedra) are hashed in too,
+# so meshes built by older code are never loaded
+CACHE_VERSION = 1
+BUILDER_MODULES = ("geometry_cache.py", "meshes.py")
+
+POLYHEDRA = {
+    "tetrahedron": Tetrahedron,
+    "octahedron": Octahedron,
+    "dodecahedron": Dodecahedron,
+    "icosahedron": Icosahedron,
+}
+
+
+class GeometryCache:
+    # On-disk store of indexed meshes: vertices (m, 3) floats and faces (n, k)
+    # vertex indices, one .npy pair per (shape, parameters). Arrays are loaded
+    # memory-mapped and read-only, so processes share the pages
+    def __init__(self, directory=None):
+        self.directory = Path(
+            directory or os.environ.get(GEOMETRY_CACHE_ENV) or DEFAULT_GEOMETRY_DIRECTORY
+        )
+        self.meshes = {}
+        self.builder_hash = self.get_builder_hash()
+
+    @staticmethod
+    def get_builder_hash():
+        hasher = hashlib.sha1(repr(CACHE_VERSION).encode())
+        for name in BUILDER_MODULES:
+            hasher.update(Path(__file__).resolve().with_name(name).read_bytes())
+        try:
+            hasher.update(metadata.version("manim").encode())
+        except metadata.PackageNotFoundError:
+            pass
+        return hasher.hexdigest()
+
+    def get_base_path(self, shape, parameters):
+        digest = hashlib.sha1(repr((self.builder_hash, shape, parameters)).encode()).hexdigest()[:16]
+        return self.directory / f"{shape}_{digest}"
+
+    def get(self, shape, parameters, build):
+        # build() -> (vertices, faces) only runs when the mesh is on neither
+        # the in-process nor the on-disk cache
+        key = (shape, parameters)
+        if key in self.meshes:
+            return self.meshes[key]
+
+        base_path = self.get_base_path(shape, parameters)
+        try:
+            mesh = (
+                np.load(f"{base_path}.vertices.npy", mmap_mode="r"),
+                np.load(f"{base_path}.faces.npy", mmap_mode="r"),
+            )
+        except (OSError, ValueError):
+            vertices, faces = build()
+            mesh = (np.asarray(vertices, dtype=float), np.asarray(faces, dtype=np.int32))
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._save(f"{base_path}.vertices.npy", mesh[0])
+            self._save(f"{base_path}.faces.npy", mesh[1])
+            for array in mesh:
+                array.setflags(write=False)
+
+        self.meshes[key] = mesh
+        return mesh
+
+    def _save(self, path, array):
+        # Write next to the target and rename, so a worker never loads a
+        # half-written file from another one
+        handle, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".npy")
+        with os.fdopen(handle, "wb") as file:
+            np.save(file, array)
+        os.replace(temporary_path, path)
+
+    def clear(self):
+        self.meshes.clear()
+        for path in self.directory.glob("*.npy"):
+            path.unlink()
+
+
+def _parametric_mesh(func, u_range, v_range, resolution):
+    # Grid mesh of func(u, v) -> (..., 3), sampled like manim's Surface
+    u_res, v_res = resolution
+    u, v = np.meshgrid(
+        np.linspace(*u_range, u_res + 1),
+        np.linspace(*v_range, v_res + 1),
+        indexing="ij",
+    )
+    grid = func(u, v)
+    return grid.reshape(-1, 3), grid_face_indices(u_res + 1, v_res + 1)
+
+
+def sphere_mesh(radius=1, resolution=None):
+    # Same parametrization as manim's Sphere. Without a resolution it is
+    # picked from the radius and the output size
+    resolution = resolution or get_sphere_resolution(radius)
+
+    def build():
+        return _parametric_mesh(
+            lambda u, v: radius * np.stack([np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), -np.cos(v)], axis=-1),
+            (0, 2 * np.pi), (0, np.pi), resolution,
+        )
+    return GEOMETRY_CACHE.get("sphere", (float(radius), tuple(resolution)), build)
+
+
+def torus_mesh(major_radius=3, minor_radius=1, resolution=None):
+    # Same parametrization as manim's Torus. Without a resolution it is
+    # picked from the radii and the output size
+    resolution = resolution or get_torus_resolution(major_radius, minor_radius)
+
+    def build():
+        def func(u, v):
+            ring = (major_radius - minor_radius * np.cos(v))[..., None]
+            return ring * np.stack([np.cos(u), np.sin(u), np.zeros_like(u)], axis=-1) + np.stack(
+                [np.zeros_like(v), np.zeros_like(v), -minor_radius * np.sin(v)], axis=-1
+            )
+        return _parametric_mesh(func, (0, 2 * np.pi), (0, 2 * np.pi), resolution)
+    return GEOMETRY_CACHE.get(
+        "torus", (float(major_radius), float(minor_radius), tuple(resolution)), build
+    )
+
+
+def polyhedron_mesh(name, edge_length=1):
+    # Vertices and faces of manim's platonic solids. Building one the first time
+    # costs a whole Polyhedron (a Graph with a Dot3D per vertex), later renders
+    # only load the arrays
+    def build():
+        polyhedron = POLYHEDRA[name](edge_length=edge_length)
+        return np.array(polyhedron.vertex_coords, dtype=float), np.array(polyhedron.faces_list)
+    return GEOMETRY_CACHE.get(name, (float(edge_length),), build)
+
+
+# Shared by every scene in the process
+GEOMETRY_CACHE = GeometryCache()
@@ -0,0 +1,120 @@
+from manim import *
+import numpy as np
+
+from colormaps import to_rgb_array
+from lod import get_sphere_resolution
+from meshes import POINTS_PER_FACE, unit_sphere_points
+
+
+class SphereGlyph(ThreeDVMobject):
+    # One instance of the shared unit-sphere mesh, stored as a single path.
+    # Only the faces turned towards the camera are drawn (see GlyphCamera),
+    # otherwise front and back faces would cancel out when the path is filled
+    def front_face_points(self, camera_position):
+        if len(self.points) == 0 or len(self.points) % POINTS_PER_FACE != 0:
+            return self.points
+
+        faces = self.points.reshape(-1, POINTS_PER_FACE, 3)
+        corners = faces[:, ::4]
+        face_centers = corners.mean(axis=1)
+
+        # Face normals from the quad diagonals, flipped to point outwards
+        normals = np.cross(corners[:, 2] - corners[:, 0], corners[:, 3] - corners[:, 1])
+        outward = np.einsum("ij,ij->i", normals, face_centers - self.get_center())
+        facing = np.einsum("ij,ij->i", normals, camera_position - face_centers)
+        front = outward * facing > 0
+
+        if not front.any():
+            return self.points
+        return faces[front].reshape(-1, 3)
+
+
+class SphereGlyphField(VGroup):
+    # Many sphere markers sharing one unit-sphere mesh. Each instance is a single
+    # SphereGlyph built from the template with one array op, instead of a Sphere
+    # made of resolution[0] * resolution[1] separate face mobjects. Without a
+    # resolution the mesh is picked from the largest radius and the output size
+    def __init__(
+        self,
+        positions,
+        radii=0.1,
+        colors=WHITE,
+        fill_opacity=1.0,
+        resolution=None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        num_glyphs = len(self.positions)
+        self.radii = np.broadcast_to(np.asarray(radii, dtype=float), (num_glyphs,)).copy()
+
+        if resolution is None:
+            resolution = get_sphere_resolution(self.radii.max() if num_glyphs else 0)
+        self.resolution = tuple(resolution)
+        self.template = unit_sphere_points(self.resolution)
+        self.colors = to_rgb_array(colors, num_glyphs)
+
+        for points, rgb in zip(self._get_glyph_points(), self.colors):
+            glyph = SphereGlyph()
+            glyph.set_points(points)
+            glyph.set_fill(rgb_to_color(rgb), opacity=fill_opacity)
+            glyph.set_stroke(width=0)
+            self.add(glyph)
+
+    def _get_glyph_points(self):
+        # (num_glyphs, points_per_glyph, 3) in one broadcast
+        return (
+            self.template[None, :, :] * self.radii[:, None, None]
+            + self.positions[:, None, :]
+        )
+
+    def set_positions(self, positions):
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        for glyph, points in zip(self.submobjects, self._get_glyph_points()):
+            glyph.set_points(points)
+        return self
+
+    def set_radii(self, radii):
+        self.radii = np.broadcast_to(np.asarray(radii, dtype=float), (len(self.positions),)).copy()
+        for glyph, points in zip(self.submobjects, self._get_glyph_points()):
+            glyph.set_points(points)
+        return self
+
+    def set_colors(self, colors, fill_opacity=None):
+        self.colors = to_rgb_array(colors, len(self.positions))
+        for glyph, rgb in zip(self.submobjects, self.colors):
+            glyph.set_fill(rgb_to_color(rgb), opacity=fill_opacity)
+        return self
+
+    def get_fingerprint_arrays(self):
+        # Mesh parameters and instance arrays for the render cache. Two anchor
+        # points and the fill of every glyph catch changes made by animations
+        glyphs = [glyph for glyph in self.submobjects if len(glyph.points)]
+        return [
+            np.array(self.resolution),
+            self.positions,
+            self.radii,
+            self.colors,
+            np.array([[glyph.points[0], glyph.points[len(glyph.points) // 2]] for glyph in glyphs]),
+            np.concatenate([glyph.fill_rgbas for glyph in glyphs]) if glyphs else np.zeros((0, 4)),
+        ]
+
+    def get_glyph_centers(self):
+        # Current centers, including any moves made through regular animations
+        return np.array([glyph.get_center() for glyph in self.submobjects])
+
+
+class GlyphCamera(ThreeDCamera):
+    # ThreeDCamera that draws each SphereGlyph as its camera-facing faces only
+    def get_camera_position(self):
+        rotation_matrix = self.get_rotation_matrix()
+        return self.frame_center + self.get_focal_distance() * rotation_matrix[2]
+
+    def transform_points_pre_display(self, mobject, points):
+        if (
+            isinstance(mobject, SphereGlyph)
+            and len(points) == len(mobject.points)
+            and mobject not in self.fixed_in_frame_mobjects
+        ):
+            points = mobject.front_face_points(self.get_camera_position())
+        return super().transform_points_pre_display(mobject, points)
@@ -0,0 +1,243 @@
+import itertools as it
+
+import numpy as np
+from manim import *
+
+from glyphs import GlyphCamera
+
+
+class BitmapLayer:
+    # Transparent frame-sized bitmap of some mobjects. Cairo leaves
+    # premultiplied pixels, so compositing is dst = src + dst * (1 - src_alpha),
+    # done on the covered pixels only
+    def __init__(self):
+        self.array = None
+        self.indices = None
+        self.pixels = None
+        self.inverse_alpha = None
+
+    def rasterize(self, camera, mobjects):
+        if self.array is None or self.array.shape != camera.pixel_array.shape:
+            self.array = np.zeros_like(camera.pixel_array)
+        else:
+            self.array[:] = 0
+        camera.display_mobjects(mobjects, self.array)
+        pixels = self.array.reshape(-1, self.array.shape[-1])
+        self.indices = np.flatnonzero(pixels[:, 3])
+        self.pixels = pixels[self.indices].astype(np.uint16)
+        self.inverse_alpha = 255 - self.pixels[:, 3:]
+
+    def composite(self, pixel_array):
+        if self.indices is None or not len(self.indices):
+            return
+        frame = pixel_array.reshape(-1, pixel_array.shape[-1])
+        background = frame[self.indices].astype(np.uint16)
+        frame[self.indices] = np.minimum(
+            self.pixels + (background * self.inverse_alpha + 127) // 255, 255
+        ).astype(pixel_array.dtype)
+
+
+class LayeredCamera(GlyphCamera):
+    # Splits every frame into cached layers.
+    #
+    # Fixed-in-frame captions are a 2D overlay: the ones that did not change
+    # since the last frame are rasterized once into a bitmap that is composited
+    # over every 3D frame, only captions whose points or colors changed (Write,
+    # FadeIn, a live readout) are rasterized again. The overlay always lands
+    # on top of the 3D scene.
+    #
+    # While the camera holds still, the mobjects that do not move in the
+    # current play() (see LayeredSceneMixin) are cached too. In draw order,
+    # the static ones after every moving mobject go into a transparent front
+    # layer, all before the first moving one into an opaque background frame,
+    # and only the moving mobjects and whatever sits between them are drawn
+    # per frame. Any camera change (move_camera, ambient
+    # rotation) drops the layers until it holds still again
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.moving_mobjects = None
+        self.depth_keys = {}
+        self.depth_state = None
+        self.previous_camera_state = None
+        self.layer_signature = None
+        self.background_frame = None
+        self.front_layer = BitmapLayer()
+        self.overlay_keys = {}
+        self.overlay_signature = None
+        self.overlay_layer = BitmapLayer()
+
+    def set_moving_mobjects(self, mobjects):
+        # Called once per play(), static mobjects may have changed in between
+        self.moving_mobjects = set(mobjects)
+        self.depth_keys = {}
+        self.layer_signature = None
+
+    def get_camera_state(self):
+        return (
+            self.get_phi(),
+            self.get_theta(),
+            self.get_gamma(),
+            self.get_focal_distance(),
+            self.get_zoom(),
+            tuple(self.frame_center),
+            self.frame_width,
+            self.frame_height,
+            self.pixel_array.shape,
+        )
+
+    def is_overlay(self, mobject):
+        return (
+            isinstance(mobject, VMobject)
+            and mobject in self.fixed_in_frame_mobjects
+            and not getattr(mobject, "shade_in_3d", False)
+        )
+
+    def get_overlay_key(self, mobject):
+        # Changes whenever the rasterized caption would
+        return hash((
+            mobject.points.tobytes(),
+            mobject.fill_rgbas.tobytes(),
+            mobject.stroke_rgbas.tobytes(),
+            mobject.background_stroke_rgbas.tobytes(),
+            mobject.stroke_width,
+            mobject.background_stroke_width,
+            mobject.get_background_image(),
+        ))
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        # Scene order, except that mobjects with shade_in_3d are sorted by
+        # depth among the places they take up. The depth keys of static
+        # mobjects are kept for as long as the camera holds still
+        if self.moving_mobjects is None:
+            return super().get_mobjects_to_display(*args, **kwargs)
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        state = self.get_camera_state()
+        if state != self.depth_state:
+            self.depth_state = state
+            self.depth_keys = {}
+        rotation_matrix = self.get_rotation_matrix()
+
+        def z_key(mobject):
+            if mobject in self.moving_mobjects:
+                return np.dot(mobject.get_z_index_reference_point(), rotation_matrix.T)[2]
+            key = self.depth_keys.get(mobject)
+            if key is None:
+                key = np.dot(mobject.get_z_index_reference_point(), rotation_matrix.T)[2]
+                self.depth_keys[mobject] = key
+            return key
+
+        shaded = [i for i, mobject in enumerate(mobjects) if getattr(mobject, "shade_in_3d", False)]
+        mobjects = list(mobjects)
+        for i, mobject in zip(shaded, sorted((mobjects[i] for i in shaded), key=z_key)):
+            mobjects[i] = mobject
+        return mobjects
+
+    def display_mobjects(self, mobjects, pixel_array):
+        # Camera.capture_mobjects without the depth sort, into any array
+        display_functions = (
+            (VMobject, self.display_multiple_vectorized_mobjects),
+            (PMobject, self.display_multiple_point_cloud_mobjects),
+            (AbstractImageMobject, self.display_multiple_image_mobjects),
+        )
+
+        def get_display_function(mobject):
+            for mobject_type, function in display_functions:
+                if isinstance(mobject, mobject_type):
+                    return function
+            return None
+
+        for function, group in it.groupby(mobjects, get_display_function):
+            if function is not None:
+                function(list(group), pixel_array)
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        self.reset_rotation_matrix()
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        scene_mobjects = []
+        static_overlays = []
+        animating_overlays = []
+        overlay_keys = {}
+        for mobject in mobjects:
+            if not self.is_overlay(mobject):
+                scene_mobjects.append(mobject)
+                continue
+            key = self.get_overlay_key(mobject)
+            overlay_keys[id(mobject)] = key
+            if self.overlay_keys.get(id(mobject)) == key:
+                static_overlays.append(mobject)
+            else:
+                animating_overlays.append(mobject)
+        self.overlay_keys = overlay_keys
+
+        self.capture_scene_mobjects(scene_mobjects)
+        if static_overlays:
+            self.update_overlay(static_overlays)
+            self.overlay_layer.composite(self.pixel_array)
+        self.display_mobjects(animating_overlays, self.pixel_array)
+
+    def capture_scene_mobjects(self, mobjects):
+        state = self.get_camera_state()
+        camera_is_still = state == self.previous_camera_state
+        self.previous_camera_state = state
+        if self.moving_mobjects is None or not camera_is_still:
+            self.layer_signature = None
+            self.display_mobjects(mobjects, self.pixel_array)
+            return
+
+        moving_indices = [i for i, mobject in enumerate(mobjects) if mobject in self.moving_mobjects]
+        first = moving_indices[0] if moving_indices else len(mobjects)
+        last = moving_indices[-1] + 1 if moving_indices else len(mobjects)
+        behind, live, front = mobjects[:first], mobjects[first:last], mobjects[last:]
+
+        signature = (state, tuple(map(id, behind)), tuple(map(id, front)))
+        if signature != self.layer_signature:
+            self.layer_signature = signature
+            self.display_mobjects(behind, self.pixel_array)
+            if self.background_frame is None or self.background_frame.shape != self.pixel_array.shape:
+                self.background_frame = self.pixel_array.copy()
+            else:
+                self.background_frame[:] = self.pixel_array
+            self.front_layer.rasterize(self, front)
+        else:
+            self.pixel_array[:] = self.background_frame
+        self.display_mobjects(live, self.pixel_array)
+        self.front_layer.composite(self.pixel_array)
+
+    def update_overlay(self, overlays):
+        # A caption that stops animating joins the cached layer one frame later,
+        # so every change costs a single re-rasterize of the static captions
+        signature = (
+            tuple((id(mobject), self.overlay_keys[id(mobject)]) for mobject in overlays),
+            tuple(self.frame_center),
+            self.frame_width,
+            self.frame_height,
+            self.pixel_array.shape,
+        )
+        if signature != self.overlay_signature:
+            self.overlay_signature = signature
+            self.overlay_layer.rasterize(self, overlays)
+
+
+class LayeredSceneMixin:
+    # Lets a LayeredCamera cache everything that does not move. Manim draws
+    # the mobjects that do not move into a static image and the rest on top,
+    # which is wrong in depth for a 3D scene, and counts every mobject after
+    # the first moving one as moving. Here the camera gets the whole scene in
+    # scene order each frame, is told which of its mobjects are animated or
+    # have updaters, and sorts out the layers itself. Mix in before the Scene
+    # class
+    def get_moving_and_static_mobjects(self, animations):
+        moving_mobjects, static_mobjects = super().get_moving_and_static_mobjects(animations)
+        camera = self.renderer.camera
+        if not isinstance(camera, LayeredCamera):
+            return moving_mobjects, static_mobjects
+        changing_mobjects = [animation.mobject for animation in animations]
+        changing_mobjects += [mobject for mobject in self.mobjects if mobject.get_family_updaters()]
+        changing_mobjects += self.foreground_mobjects
+        camera.set_moving_mobjects(extract_mobject_family_members(changing_mobjects))
+        scene_mobjects = extract_mobject_family_members(
+            list_update(self.mobjects, self.foreground_mobjects),
+            use_z_index=camera.use_z_index,
+            only_those_with_points=True,
+        )
+        return scene_mobjects, []
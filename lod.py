@@ -0,0 +1,38 @@
+import numpy as np
+from manim import config
+
+# How far (in output pixels) a tessellated outline may sit inside the true
+# curve. About a pixel is hidden by anti-aliasing and the face strokes
+LOD_TOLERANCE_PIXELS = 1.0
+
+# Segments around a full circle, the low end keeps tiny markers round-ish
+MIN_CIRCLE_SEGMENTS = 6
+MAX_CIRCLE_SEGMENTS = 128
+
+
+def get_pixels_per_unit(zoom=1.0):
+    # Output pixels per scene unit at the frame center
+    return config.pixel_height / config.frame_height * zoom
+
+
+def get_circle_segments(radius, zoom=1.0, tolerance=LOD_TOLERANCE_PIXELS):
+    # Segments around a full circle of the given radius (scene units) so the
+    # chords stay within tolerance pixels of the arc:
+    # sagitta = r * (1 - cos(pi / n)) ~ r * pi^2 / (2 n^2)
+    radius_pixels = max(float(radius), 0.0) * get_pixels_per_unit(zoom)
+    segments = int(np.ceil(np.pi * np.sqrt(radius_pixels / (2 * tolerance))))
+    return int(np.clip(segments, MIN_CIRCLE_SEGMENTS, MAX_CIRCLE_SEGMENTS))
+
+
+def get_sphere_resolution(radius, zoom=1.0, tolerance=LOD_TOLERANCE_PIXELS):
+    # (u, v) for a sphere: u runs around the equator, v from pole to pole
+    u_segments = get_circle_segments(radius, zoom, tolerance)
+    return u_segments, max(u_segments // 2, MIN_CIRCLE_SEGMENTS // 2)
+
+
+def get_torus_resolution(major_radius, minor_radius, zoom=1.0, tolerance=LOD_TOLERANCE_PIXELS):
+    # (u, v) for a torus: u runs around the outer rim, v around the tube
+    return (
+        get_circle_segments(major_radius + minor_radius, zoom, tolerance),
+        get_circle_segments(minor_radius, zoom, tolerance),
+    )
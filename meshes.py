@@ -0,0 +1,77 @@
+from functools import lru_cache
+
+import numpy as np
+
+# VMobject.set_points_as_corners turns every polygon edge into a cubic curve
+# with 4 points, so a quad face (5 corners, closed) becomes 16 points
+POINTS_PER_CURVE = 4
+POINTS_PER_FACE = 4 * POINTS_PER_CURVE
+
+
+def corners_to_bezier_points(corners):
+    # Batched version of VMobject.set_points_as_corners.
+    # corners has shape (..., k, 3) with the polygon closed (first == last);
+    # returns (..., (k - 1) * 4, 3) cubic bezier points
+    corners = np.asarray(corners, dtype=float)
+    start = corners[..., :-1, None, :]
+    end = corners[..., 1:, None, :]
+    alphas = np.linspace(0, 1, POINTS_PER_CURVE)[:, None]
+    points = start + (end - start) * alphas
+    return points.reshape(*corners.shape[:-2], -1, 3)
+
+
+def grid_to_quads(grid):
+    # Turn a (rows, cols, 3) grid of points into closed quad faces of shape
+    # (rows - 1, cols - 1, 5, 3), using the same corner order as manim's Surface
+    grid = np.asarray(grid, dtype=float)
+    return np.stack([
+        grid[:-1, :-1],
+        grid[1:, :-1],
+        grid[1:, 1:],
+        grid[:-1, 1:],
+        grid[:-1, :-1],
+    ], axis=-2)
+
+
+def grid_face_indices(rows, cols):
+    # Vertex indices of the quads of a (rows, cols) grid flattened row-major,
+    # shape ((rows - 1) * (cols - 1), 4), same corner order as grid_to_quads
+    index = np.arange(rows * cols).reshape(rows, cols)
+    return np.stack([
+        index[:-1, :-1],
+        index[1:, :-1],
+        index[1:, 1:],
+        index[:-1, 1:],
+    ], axis=-1).reshape(-1, 4)
+
+
+def mesh_to_polygons(vertices, faces):
+    # Indexed mesh (vertices (m, 3), faces (n, k) indices) to closed polygon
+    # corners of shape (n, k + 1, 3)
+    faces = np.asarray(faces)
+    return np.asarray(vertices, dtype=float)[np.concatenate([faces, faces[:, :1]], axis=1)]
+
+
+@lru_cache(maxsize=None)
+def unit_sphere_faces(resolution=(8, 8)):
+    # Quad faces of a unit sphere, parametrized exactly like manim's Sphere.
+    # Cached per resolution and returned read-only so it can be shared
+    u_res, v_res = resolution
+    u, v = np.meshgrid(
+        np.linspace(0, 2 * np.pi, u_res + 1),
+        np.linspace(0, np.pi, v_res + 1),
+        indexing="ij",
+    )
+    grid = np.stack([np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), -np.cos(v)], axis=-1)
+    faces = grid_to_quads(grid).reshape(-1, 5, 3)
+    faces.setflags(write=False)
+    return faces
+
+
+@lru_cache(maxsize=None)
+def unit_sphere_points(resolution=(8, 8)):
+    # Bezier points of every face of the unit sphere, flattened to (n, 3)
+    points = corners_to_bezier_points(unit_sphere_faces(resolution)).reshape(-1, 3)
+    points.setflags(write=False)
+    return points
+
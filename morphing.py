@@ -0,0 +1,112 @@
+from manim import *
+import numpy as np
+
+from colormaps import to_rgb_array
+from geometry_cache import GEOMETRY_CACHE, polyhedron_mesh, sphere_mesh
+from lod import get_sphere_resolution
+from meshes import grid_face_indices, mesh_to_polygons
+
+# Polyhedron edges cut across grid faces, so morph grids never go below this
+MIN_MORPH_RESOLUTION = (32, 16)
+
+
+# Every shape below is sampled on the same (u, v) grid as sphere_mesh:
+# u in [0, 2π] around the z axis, v in [0, π] from the bottom pole to the top.
+# Vertex i of one shape corresponds to vertex i of every other, and they all
+# share the face indices, so morphing is a plain lerp of the vertex arrays
+
+
+def get_morph_resolution(radius):
+    # One resolution for a whole morph chain, from its largest shape
+    u_res, v_res = get_sphere_resolution(radius)
+    return max(u_res, MIN_MORPH_RESOLUTION[0]), max(v_res, MIN_MORPH_RESOLUTION[1])
+
+
+def _get_directions(resolution):
+    # Unit sphere vertices, i.e. the ray direction of every grid vertex
+    vertices, _ = sphere_mesh(1, resolution)
+    return np.asarray(vertices)
+
+
+def _ray_cast_convex(vertices, faces, directions):
+    # Where rays from the origin leave a convex polyhedron that contains it
+    vertices = np.asarray(vertices, dtype=float)
+    corners = vertices[np.asarray(faces)[:, :3]]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    offsets = np.einsum("ij,ij->i", normals, corners[:, 0])
+    # Orient every plane outwards
+    normals[offsets < 0] *= -1
+    offsets = np.abs(offsets)
+
+    with np.errstate(divide="ignore"):
+        denominators = directions @ normals.T
+        distances = np.where(denominators > 1e-12, offsets / denominators, np.inf)
+    return directions * distances.min(axis=1, keepdims=True)
+
+
+def polyhedron_morph_mesh(name, resolution, edge_length=1):
+    # Platonic solid projected radially onto the morph grid
+    def build():
+        vertices, faces = polyhedron_mesh(name, edge_length)
+        return (
+            _ray_cast_convex(vertices, faces, _get_directions(resolution)),
+            grid_face_indices(resolution[0] + 1, resolution[1] + 1),
+        )
+    return GEOMETRY_CACHE.get(f"{name}_morph", (float(edge_length), tuple(resolution)), build)
+
+
+def sphere_morph_mesh(radius, resolution):
+    return sphere_mesh(radius, resolution)
+
+
+def torus_morph_mesh(major_radius, minor_radius, resolution):
+    # Torus on the morph grid: the tube angle runs θ = π - 2v, so the bottom
+    # hemisphere becomes the lower half of the tube, the equator the inner rim
+    # and both poles open up into the outer rim
+    def build():
+        u_res, v_res = resolution
+        u, v = np.meshgrid(
+            np.linspace(0, 2 * np.pi, u_res + 1),
+            np.linspace(0, np.pi, v_res + 1),
+            indexing="ij",
+        )
+        theta = np.pi - 2 * v
+        ring = major_radius - minor_radius * np.cos(theta)
+        grid = np.stack([ring * np.cos(u), ring * np.sin(u), -minor_radius * np.sin(theta)], axis=-1)
+        return grid.reshape(-1, 3), grid_face_indices(u_res + 1, v_res + 1)
+    return GEOMETRY_CACHE.get(
+        "torus_morph", (float(major_radius), float(minor_radius), tuple(resolution)), build
+    )
+
+
+class Morph(Animation):
+    # Moves every face of a MeshSurface to the matching face of a target mesh
+    # on the same grid, one array lerp per frame. Colors are blended when
+    # target_colors is given
+    def __init__(self, surface, target_mesh, target_colors=None, **kwargs):
+        self.target_faces = mesh_to_polygons(*target_mesh)
+        if self.target_faces.shape != surface.faces.shape:
+            raise ValueError(
+                f"Morph target has faces {self.target_faces.shape}, "
+                f"the surface has {surface.faces.shape}; build both on the same grid"
+            )
+        self.target_colors = target_colors
+        super().__init__(surface, **kwargs)
+
+    def create_starting_mobject(self):
+        # The start is kept as arrays in begin, no copy of every face needed
+        return Mobject()
+
+    def begin(self):
+        self.start_faces = self.mobject.faces.copy()
+        self.start_colors = self.mobject.face_colors.copy()
+        if self.target_colors is not None:
+            self.end_colors = to_rgb_array(self.target_colors, len(self.start_colors))
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        self.mobject.set_faces(self.start_faces + alpha * (self.target_faces - self.start_faces))
+        if self.target_colors is not None:
+            self.mobject.set_face_colors(self.start_colors + alpha * (self.end_colors - self.start_colors))
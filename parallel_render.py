@@ -0,0 +1,135 @@
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Name of the only section a render should produce frames for
+SECTION_ENV = "MANIM_RENDER_SECTION"
+
+
+class SectionedSceneMixin:
+    # Scenes split into named sections that each start from a known state.
+    # When SECTION_ENV is set, every other section still runs (so the state is
+    # right) but with skip_animations, so only the selected one is rendered.
+    # Scenes list their section names in get_section_names. Mix in before the
+    # Scene class
+    @classmethod
+    def get_section_names(cls):
+        return []
+
+    def next_section(self, name="unnamed", *args, skip_animations=False, **kwargs):
+        selected = os.environ.get(SECTION_ENV)
+        if selected:
+            skip_animations = skip_animations or name != selected
+        super().next_section(name, *args, skip_animations=skip_animations, **kwargs)
+
+
+def get_scene_class(script, scene_name):
+    # Import the scene module the way manim does, with its directory on the path
+    script = Path(script).resolve()
+    sys.path.insert(0, str(script.parent))
+    return getattr(importlib.import_module(script.stem), scene_name)
+
+
+def write_section_config(script, scene_name, section, media_dir):
+    # manim.cfg giving the section its own partial movie directory. It is kept
+    # between runs, like the partial movie files, so the play cache still
+    # works for sections that did not change
+    config_file = Path(media_dir, "sections", Path(script).stem, scene_name, f"{section}.cfg")
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    config_file.write_text(
+        "[CLI]\n"
+        f"partial_movie_dir = {{video_dir}}/partial_movie_files/{scene_name}/{section}\n"
+    )
+    return config_file
+
+
+def render_section(script, scene_name, section, media_dir, quality, extra_args=()):
+    # Render one section in its own manim process. All sections share the
+    # media directory, so the Tex, text and geometry caches are built once,
+    # and only the partial movie files and the output movie are kept apart.
+    # Returns the movie path
+    output_name = f"{scene_name}_{section}"
+    command = [
+        sys.executable, "-m", "manim", "render",
+        f"-q{quality}",
+        "--media_dir", str(media_dir),
+        "--config_file", str(write_section_config(script, scene_name, section, media_dir)),
+        "-o", output_name,
+        *extra_args,
+        str(script), scene_name,
+    ]
+    environment = dict(os.environ, **{SECTION_ENV: section})
+    subprocess.run(command, env=environment, check=True)
+    movies = [
+        path for path in Path(media_dir, "videos", Path(script).stem).rglob(f"{output_name}.*")
+        if "partial_movie_files" not in path.parts and path.suffix in (".mp4", ".mov", ".webm")
+    ]
+    if not movies:
+        raise RuntimeError(f"Section {section!r} of {scene_name} produced no movie in {media_dir}")
+    return max(movies, key=lambda path: path.stat().st_mtime)
+
+
+def concatenate_movies(movies, output_file):
+    # Sections share codec and settings, so the concat demuxer can join them
+    # without re-encoding
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file_list:
+        for movie in movies:
+            file_list.write(f"file '{Path(movie).resolve().as_posix()}'\n")
+    try:
+        subprocess.run([
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0",
+            "-i", file_list.name,
+            "-c", "copy",
+            str(output_file),
+        ], check=True)
+    finally:
+        os.unlink(file_list.name)
+    return output_file
+
+
+def render_parallel(script, scene_name, quality="l", jobs=None, media_dir="media", extra_args=()):
+    script = Path(script)
+    sections = get_scene_class(script, scene_name).get_section_names()
+    if not sections:
+        raise ValueError(f"{scene_name} does not declare any sections")
+    jobs = jobs or os.cpu_count() or 1
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(sections))) as pool:
+        futures = [
+            pool.submit(
+                render_section, script, scene_name, section,
+                media_dir, quality, extra_args,
+            )
+            for section in sections
+        ]
+        movies = [future.result() for future in futures]
+
+    # The section movies sit where a normal render writes to, e.g.
+    # media/videos/<script>/1080p60, and so does the joined one
+    return concatenate_movies(movies, movies[0].parent / f"{scene_name}{movies[0].suffix}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render the sections of a scene in parallel and join them"
+    )
+    parser.add_argument("script")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", default="l", choices="lmhpk")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="default: one per core")
+    parser.add_argument("--media_dir", default="media")
+    args, extra_args = parser.parse_known_args()
+    output_file = render_parallel(
+        args.script, args.scene, args.quality, args.jobs, args.media_dir, extra_args
+    )
+    print(output_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+from collections import namedtuple
+
+import numpy as np
+
+# t: arc-length fraction in [0, 1] of every sample
+# points: (n, 3) points on the curve, z: the same points as complex numbers
+# dz_dt: complex tangent with respect to t, so |dz_dt| is the path length
+PathSample = namedtuple("PathSample", ["t", "points", "z", "dz_dt"])
+
+# Gauss-Legendre nodes used to measure the length of each table interval
+_GAUSS_X, _GAUSS_W = np.polynomial.legendre.leggauss(5)
+
+
+class BezierPathSampler:
+    # Samples a VMobject's cubic Bezier curves at arc-length uniform parameters.
+    # An instance can be passed as the `path` of integrate_contour
+    def __init__(self, vmobject_or_points, table_resolution=64):
+        points = getattr(vmobject_or_points, "points", vmobject_or_points)
+        points = np.asarray(points, dtype=float)
+        self.curves = points[: len(points) // 4 * 4].reshape(-1, 4, 3)
+        self.num_curves = len(self.curves)
+
+        # Arc length table over the global curve parameter u in [0, num_curves]
+        self.table_u = np.linspace(0, self.num_curves, self.num_curves * table_resolution + 1)
+        self.table_length = np.concatenate([
+            [0],
+            np.cumsum(self._interval_lengths(self.table_u[:-1], self.table_u[1:])),
+        ])
+        self.length = self.table_length[-1]
+
+    def _evaluate(self, u):
+        # Position and derivative (with respect to u) for global parameters u
+        u = np.asarray(u, dtype=float)
+        index = np.clip(np.floor(u).astype(int), 0, self.num_curves - 1)
+        s = (u - index)[..., None]
+        p0, p1, p2, p3 = np.moveaxis(self.curves[index], -2, 0)
+        point = (
+            (1 - s) ** 3 * p0
+            + 3 * (1 - s) ** 2 * s * p1
+            + 3 * (1 - s) * s ** 2 * p2
+            + s ** 3 * p3
+        )
+        derivative = 3 * (
+            (1 - s) ** 2 * (p1 - p0)
+            + 2 * (1 - s) * s * (p2 - p1)
+            + s ** 2 * (p3 - p2)
+        )
+        return point, derivative
+
+    def _speed(self, u):
+        return np.linalg.norm(self._evaluate(u)[1], axis=-1)
+
+    def _interval_lengths(self, u_start, u_end):
+        half = (u_end - u_start) / 2
+        middle = (u_end + u_start) / 2
+        # Keep samples inside [u_start, u_end] so they stay on the right curve
+        nodes = middle[:, None] + half[:, None] * _GAUSS_X[None, :]
+        return half * (self._speed(nodes) @ _GAUSS_W)
+
+    def _arc_length_to_u(self, arc_length):
+        # Invert the length table, then polish with one Newton step
+        u = np.interp(arc_length, self.table_length, self.table_u)
+        knot = np.clip(np.searchsorted(self.table_u, u, side="right") - 1, 0, len(self.table_u) - 2)
+        length_at_u = self.table_length[knot] + self._interval_lengths(self.table_u[knot], u)
+        speed = self._speed(u)
+        step = np.divide(length_at_u - arc_length, speed, out=np.zeros_like(u), where=speed > 0)
+        return np.clip(u - step, 0, self.num_curves)
+
+    def _evaluate_arc_length(self, t):
+        # Points and dz/dt at arc-length fractions t
+        t = np.asarray(t, dtype=float)
+        point, derivative = self._evaluate(self._arc_length_to_u(t * self.length))
+        speed = np.linalg.norm(derivative, axis=-1, keepdims=True)
+        tangent = np.divide(derivative, speed, out=np.zeros_like(derivative), where=speed > 0)
+        return point, self.length * (tangent[..., 0] + 1j * tangent[..., 1])
+
+    def __call__(self, t):
+        # Position (as complex) and dz/dt, the signature integrate_contour expects
+        point, dz_dt = self._evaluate_arc_length(t)
+        return point[..., 0] + 1j * point[..., 1], dz_dt
+
+    def get_corner_parameters(self, angle_tolerance=1e-3):
+        # Arc-length fractions of the joints where the tangent direction jumps,
+        # e.g. the vertices of paths built with set_points_as_corners
+        if self.num_curves < 2:
+            return np.zeros(0)
+        incoming = self.curves[:-1, 3] - self.curves[:-1, 2]
+        outgoing = self.curves[1:, 1] - self.curves[1:, 0]
+        norms = np.linalg.norm(incoming, axis=-1) * np.linalg.norm(outgoing, axis=-1)
+        cosines = np.divide(
+            np.einsum("ij,ij->i", incoming, outgoing), norms,
+            out=np.ones(len(norms)), where=norms > 0,
+        )
+        joints = np.flatnonzero(cosines < np.cos(angle_tolerance)) + 1
+        return self.table_length[joints * (len(self.table_u) - 1) // self.num_curves] / self.length
+
+    def sample(self, num_samples, include_corners=False):
+        t = np.linspace(0, 1, num_samples)
+        if include_corners:
+            t = np.union1d(t, self.get_corner_parameters())
+            # Drop corners that coincide with a uniform sample
+            t = t[np.concatenate([[True], np.diff(t) > 1e-9])]
+        point, dz_dt = self._evaluate_arc_length(t)
+        return PathSample(t, point, point[:, 0] + 1j * point[:, 1], dz_dt)
+
+
+def sample_path(vmobject, num_samples, include_corners=False):
+    return BezierPathSampler(vmobject).sample(num_samples, include_corners)
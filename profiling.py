@@ -0,0 +1,181 @@
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from manim import *
+
+# Set to 1 to profile into <media_dir>/profiles, or to a directory to write to
+PROFILE_ENV = "MANIM_PROFILE"
+
+# Columns of the summary table, in pipeline order. "write" is the time
+# write_frame takes to hand a frame over; with manim 0.19's writer thread
+# and in streaming mode the encoding itself runs elsewhere
+PHASES = ("updaters", "interpolate", "depth_sort", "rasterize", "write", "other")
+
+
+class CallRecord:
+    # Time and frame statistics of one play()/wait()/move_camera() call
+    def __init__(self, kind, location):
+        self.kind = kind
+        self.location = location
+        self.total = 0.0
+        self.phases = defaultdict(float)
+        self.frames = 0
+        self.mobjects = 0
+        self.points = 0
+
+
+class RenderProfiler:
+    # Nested wall-clock regions. Every region's self time (its time minus
+    # its children's) is added to its full stack, which is exactly the folded
+    # format flame graph tools read
+    def __init__(self, root):
+        self.root = root
+        self.stack = []
+        self.folded = defaultdict(float)
+        self.calls = []
+        self.current_call = None
+
+    def push(self, name):
+        self.stack.append([name, time.perf_counter(), 0.0])
+
+    def pop(self):
+        name, start, child_time = self.stack.pop()
+        elapsed = time.perf_counter() - start
+        self_time = elapsed - child_time
+        self.folded[(self.root, *(frame[0] for frame in self.stack), name)] += self_time
+        if self.stack:
+            self.stack[-1][2] += elapsed
+        if self.current_call is not None:
+            self.current_call.phases[name if name in PHASES else "other"] += self_time
+        return elapsed
+
+    def wrap(self, function, name):
+        def wrapper(*args, **kwargs):
+            self.push(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.pop()
+        return wrapper
+
+    def get_folded_lines(self):
+        # "frame;frame;frame <microseconds>" per stack
+        return [
+            f"{';'.join(stack)} {round(seconds * 1e6)}"
+            for stack, seconds in sorted(self.folded.items())
+            if seconds > 0
+        ]
+
+    def get_summary_table(self):
+        header = f"{'call':<42}{'total':>9}" + "".join(f"{phase:>12}" for phase in PHASES)
+        header += f"{'frames':>8}{'mobs/fr':>9}{'pts/fr':>10}"
+        lines = [header, "-" * len(header)]
+        for call in sorted(self.calls, key=lambda call: call.total, reverse=True):
+            frames = max(call.frames, 1)
+            lines.append(
+                f"{call.kind + ' ' + call.location:<42.42}{call.total:>8.2f}s"
+                + "".join(f"{call.phases[phase]:>11.2f}s" for phase in PHASES)
+                + f"{call.frames:>8d}{call.mobjects / frames:>9.0f}{call.points / frames:>10.0f}"
+            )
+        total = sum(call.total for call in self.calls)
+        lines.append("-" * len(header))
+        lines.append(
+            f"{'all ' + str(len(self.calls)) + ' calls':<42}{total:>8.2f}s"
+            + "".join(f"{sum(call.phases[phase] for call in self.calls):>11.2f}s" for phase in PHASES)
+        )
+        return "\n".join(lines)
+
+
+class ProfiledSceneMixin:
+    # Times every play()/wait()/move_camera() call when PROFILE_ENV is set and
+    # splits it into updater, interpolation, depth sort, rasterize and frame
+    # write time, with the mobjects and points drawn per frame. Writes a folded
+    # flame graph trace and logs a summary table when the scene is torn down.
+    # Mix in first, before the other scene mixins
+    profiler = None
+
+    def render(self, preview=False):
+        if not os.environ.get(PROFILE_ENV):
+            return super().render(preview)
+
+        self.profiler = profiler = RenderProfiler(type(self).__name__)
+        camera = self.renderer.camera
+        file_writer = self.renderer.file_writer
+        # update_to_time interpolates the animations and calls the updaters,
+        # which are timed on their own as a nested region
+        patches = [
+            (self, "update_to_time", "interpolate"),
+            (self, "begin_animations", "interpolate"),
+            (self, "update_mobjects", "updaters"),
+            (camera, "get_mobjects_to_display", "depth_sort"),
+            (file_writer, "write_frame", "write"),
+        ]
+        for owner, attribute, name in patches:
+            setattr(owner, attribute, profiler.wrap(getattr(owner, attribute), name))
+        capture_mobjects = profiler.wrap(camera.capture_mobjects, "rasterize")
+
+        def counting_capture_mobjects(mobjects, **kwargs):
+            if profiler.current_call is not None:
+                family = extract_mobject_family_members(mobjects, only_those_with_points=True)
+                profiler.current_call.mobjects += len(family)
+                profiler.current_call.points += sum(len(mobject.points) for mobject in family)
+            return capture_mobjects(mobjects, **kwargs)
+
+        def counting_write_frame(frame, num_frames=1):
+            # manim >= 0.19 passes held frames once with num_frames
+            if profiler.current_call is not None:
+                profiler.current_call.frames += num_frames
+            if num_frames == 1:
+                return write_frame(frame)
+            return write_frame(frame, num_frames=num_frames)
+
+        write_frame = file_writer.write_frame
+        camera.capture_mobjects = counting_capture_mobjects
+        file_writer.write_frame = counting_write_frame
+        try:
+            return super().render(preview)
+        finally:
+            for owner, attribute, _ in patches:
+                vars(owner).pop(attribute, None)
+            vars(camera).pop("capture_mobjects", None)
+
+    def profile_call(self, kind, function, *args, **kwargs):
+        # Only the outermost call is recorded: wait() and move_camera() go
+        # through play() themselves
+        profiler = self.profiler
+        if profiler is None or profiler.current_call is not None:
+            return function(*args, **kwargs)
+        caller = sys._getframe(2)
+        location = f"{caller.f_code.co_name}:{caller.f_lineno}"
+        profiler.current_call = call = CallRecord(kind, location)
+        profiler.push(f"{location} {kind}")
+        try:
+            return function(*args, **kwargs)
+        finally:
+            call.total = profiler.pop()
+            profiler.current_call = None
+            profiler.calls.append(call)
+
+    def play(self, *args, **kwargs):
+        return self.profile_call("play", super().play, *args, **kwargs)
+
+    def wait(self, *args, **kwargs):
+        return self.profile_call("wait", super().wait, *args, **kwargs)
+
+    def move_camera(self, *args, **kwargs):
+        return self.profile_call("move_camera", super().move_camera, *args, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self.profiler is None:
+            return
+        setting = os.environ[PROFILE_ENV]
+        directory = Path(config.media_dir, "profiles") if setting in ("1", "true") else Path(setting)
+        directory.mkdir(parents=True, exist_ok=True)
+        folded_file = directory / f"{type(self).__name__}.folded"
+        folded_file.write_text("\n".join(self.profiler.get_folded_lines()) + "\n")
+        logger.info(f"Render profile of {type(self).__name__}:\n{self.profiler.get_summary_table()}")
+        logger.info(f"Flame graph trace written to {folded_file}")
@@ -0,0 +1,301 @@
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from pathlib import Path
+
+# manim's quality flags, in the order the README lists them
+DEFAULT_QUALITIES = "lmh"
+
+# Output directory manim uses for each quality flag, and its pixels per second
+QUALITY_DIRECTORIES = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+QUALITY_PIXEL_RATES = {
+    "l": 854 * 480 * 15,
+    "m": 1280 * 720 * 30,
+    "h": 1920 * 1080 * 60,
+    "p": 2560 * 1440 * 60,
+    "k": 3840 * 2160 * 60,
+}
+
+# Base classes from manim that make a class a scene
+MANIM_SCENE_CLASSES = {
+    "Scene",
+    "ThreeDScene",
+    "SpecialThreeDScene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+}
+
+# Environment variables that change what a render produces
+RENDER_ENVIRONMENT = (
+    "MANIM_DRAFT",
+    "MANIM_RENDER_SECTION",
+    "MANIM_STREAMING",
+)
+
+STAMP_FILE = "render_stamps.json"
+
+# One scene at one quality. hash covers the script, its local imports and
+# the render settings
+RenderTarget = namedtuple(
+    "RenderTarget",
+    ["key", "script", "scene", "quality", "dependencies", "hash", "movie"],
+)
+
+
+def get_base_names(class_node):
+    # Last part of every base, so "manim.Scene" and "Scene" both count
+    names = []
+    for base in class_node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def get_local_imports(tree, modules):
+    # Names of the sibling modules a script imports
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imported.add(node.module.split(".")[0])
+    return imported & set(modules)
+
+
+def discover_scenes(directory):
+    # (script, scene) for every Scene subclass in the directory's scripts, and
+    # every script's local imports. Scripts are only parsed, never imported
+    scripts = {path.stem: path for path in sorted(Path(directory).glob("*.py"))}
+    trees = {}
+    for name, path in scripts.items():
+        try:
+            trees[name] = ast.parse(path.read_text(), filename=str(path))
+        except SyntaxError as error:
+            print(f"Skipping {path.name}: {error}", file=sys.stderr)
+
+    classes = {
+        (name, node.name): get_base_names(node)
+        for name, tree in trees.items()
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+    }
+    # Subclasses of local scene classes are scenes too, so repeat until
+    # nothing new turns up
+    scene_names = set(MANIM_SCENE_CLASSES)
+    while True:
+        found = {
+            class_name for (_, class_name), bases in classes.items()
+            if scene_names & set(bases)
+        }
+        if found <= scene_names:
+            break
+        scene_names |= found
+
+    scenes = [
+        (scripts[name], class_name)
+        for (name, class_name), bases in classes.items()
+        if scene_names & set(bases)
+    ]
+    imports = {name: get_local_imports(tree, scripts) for name, tree in trees.items()}
+    return scenes, scripts, imports
+
+
+def get_dependencies(script, scripts, imports):
+    # The script and every local module it imports, directly or not
+    dependencies = set()
+    pending = [Path(script).stem]
+    while pending:
+        name = pending.pop()
+        if name in dependencies or name not in scripts:
+            continue
+        dependencies.add(name)
+        pending.extend(imports.get(name, ()))
+    return sorted(scripts[name] for name in dependencies)
+
+
+def get_manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def get_target_hash(dependencies, scene_name, quality, extra_args):
+    hasher = hashlib.sha256()
+    for path in dependencies:
+        hasher.update(path.name.encode())
+        hasher.update(path.read_bytes())
+    hasher.update(repr((
+        scene_name,
+        quality,
+        tuple(extra_args),
+        get_manim_version(),
+        tuple(os.environ.get(name) for name in RENDER_ENVIRONMENT),
+    )).encode())
+    return hasher.hexdigest()
+
+
+def get_movie_path(media_dir, script, scene_name, quality):
+    return Path(media_dir, "videos", Path(script).stem, QUALITY_DIRECTORIES[quality], f"{scene_name}.mp4")
+
+
+class RenderStamps:
+    # Hash and render time of every finished target, so unchanged ones are
+    # skipped and the rest can be ordered by how long they took last time
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        try:
+            self.stamps = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.stamps = {}
+
+    def is_up_to_date(self, key, target_hash, movie):
+        stamp = self.stamps.get(key)
+        return stamp is not None and stamp["hash"] == target_hash and Path(movie).exists()
+
+    def get_seconds(self, key):
+        return self.stamps.get(key, {}).get("seconds")
+
+    def update(self, key, target_hash, seconds):
+        with self.lock:
+            self.stamps[key] = {"hash": target_hash, "seconds": seconds}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle, temporary_path = tempfile.mkstemp(dir=self.path.parent, suffix=".json")
+            with os.fdopen(handle, "w") as file:
+                json.dump(self.stamps, file, indent=2, sort_keys=True)
+            os.replace(temporary_path, self.path)
+
+
+def estimate_cost(target, stamps):
+    # Seconds the last render took, or else pixels per second times the size
+    # of the sources as a rough stand-in for the amount of animation
+    seconds = stamps.get_seconds(target.key)
+    if seconds is not None:
+        return seconds
+    source_size = sum(path.stat().st_size for path in target.dependencies)
+    return QUALITY_PIXEL_RATES[target.quality] * source_size * 1e-9
+
+
+def get_targets(directory, qualities, scene_filter, media_dir, extra_args):
+    scenes, scripts, imports = discover_scenes(directory)
+    targets = []
+    for script, scene_name in scenes:
+        if scene_filter and scene_name not in scene_filter:
+            continue
+        dependencies = get_dependencies(script, scripts, imports)
+        for quality in qualities:
+            targets.append(RenderTarget(
+                f"{script.name}:{scene_name}:{quality}",
+                script,
+                scene_name,
+                quality,
+                dependencies,
+                get_target_hash(dependencies, scene_name, quality, extra_args),
+                get_movie_path(media_dir, script, scene_name, quality),
+            ))
+    return targets
+
+
+def render_target(target, stamps, media_dir, extra_args):
+    command = [
+        sys.executable, "-m", "manim", "render",
+        f"-q{target.quality}",
+        "--media_dir", str(media_dir),
+        *extra_args,
+        str(target.script), target.scene,
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    seconds = time.perf_counter() - start
+    if result.returncode != 0:
+        return target, False, seconds, result.stdout + result.stderr
+    stamps.update(target.key, target.hash, seconds)
+    return target, True, seconds, ""
+
+
+def render_all(
+    directory=".",
+    qualities=DEFAULT_QUALITIES,
+    scene_filter=(),
+    jobs=None,
+    media_dir="media",
+    force=False,
+    dry_run=False,
+    extra_args=(),
+):
+    stamps = RenderStamps(Path(media_dir, STAMP_FILE))
+    targets = get_targets(directory, qualities, scene_filter, media_dir, extra_args)
+    pending = [
+        target for target in targets
+        if force or not stamps.is_up_to_date(target.key, target.hash, target.movie)
+    ]
+    # The pool takes jobs in submission order, so the cheap ones finish first
+    pending.sort(key=lambda target: estimate_cost(target, stamps))
+    print(f"{len(targets)} targets, {len(targets) - len(pending)} up to date, {len(pending)} to render")
+    if dry_run:
+        for target in pending:
+            print(f"  {target.key}")
+        return []
+
+    failures = []
+    jobs = jobs or max((os.cpu_count() or 1) // 2, 1)
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(render_target, target, stamps, media_dir, extra_args)
+            for target in pending
+        ]
+        for future in futures:
+            target, succeeded, seconds, log = future.result()
+            if succeeded:
+                print(f"{target.key:<60} {seconds:8.1f}s  {target.movie}")
+            else:
+                print(f"{target.key:<60} FAILED after {seconds:.1f}s\n{log}", file=sys.stderr)
+                failures.append(target)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render every scene at every quality whose sources or settings changed"
+    )
+    parser.add_argument("directory", nargs="?", default=".")
+    parser.add_argument("-q", "--qualities", default=DEFAULT_QUALITIES, help="e.g. lmh")
+    parser.add_argument("-s", "--scene", action="append", default=[], help="only these scenes")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="default: half the cores")
+    parser.add_argument("--media_dir", default="media")
+    parser.add_argument("--force", action="store_true", help="render up-to-date targets too")
+    parser.add_argument("--dry-run", action="store_true", help="only list what would render")
+    args, extra_args = parser.parse_known_args()
+    unknown = set(args.qualities) - set(QUALITY_DIRECTORIES)
+    if unknown:
+        parser.error(f"unknown qualities: {''.join(sorted(unknown))}")
+    failures = render_all(
+        args.directory, args.qualities, args.scene, args.jobs,
+        args.media_dir, args.force, args.dry_run, extra_args,
+    )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import hashlib
+import inspect
+import os
+import types
+from pathlib import Path
+
+import numpy as np
+from manim import *
+import manim.renderer.cairo_renderer as cairo_renderer
+
+# Video formats manim writes partial movie files in
+CACHED_SUFFIXES = (".mp4", ".mov", ".webm", ".gif", ".png")
+
+# Part of every fingerprint. Bump it whenever what the fingerprint covers
+# changes, so segments cached under the old rules are never reused
+FINGERPRINT_VERSION = 2
+
+# Camera attributes that are frame buffers or derived caches, not settings
+UNHASHED_CAMERA_ATTRIBUTES = {"pixel_array", "background", "background_frame", "rotation_matrix"}
+
+
+class RenderCache:
+    # Size-bounded LRU store of partial movie files. Files are "used" by touching
+    # their mtime, eviction removes the least recently used ones first
+    def __init__(self, directory, max_bytes=2 * 1024 ** 3):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def get_entries(self):
+        if not self.directory.exists():
+            return []
+        return [
+            path for path in self.directory.iterdir()
+            if path.is_file() and path.suffix in CACHED_SUFFIXES
+        ]
+
+    def touch(self, key):
+        for path in self.directory.glob(f"{key}.*"):
+            os.utime(path)
+
+    def get_size(self):
+        return sum(path.stat().st_size for path in self.get_entries())
+
+    def evict(self, keep=()):
+        # Delete the oldest entries until the store fits in max_bytes.
+        # Entries named in keep (the current render's segments) are never removed
+        entries = sorted(self.get_entries(), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in entries)
+        removed = []
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            if path.stem in keep:
+                continue
+            total -= path.stat().st_size
+            path.unlink()
+            removed.append(path)
+        return removed
+
+
+def _update_with_array(hasher, array):
+    array = np.ascontiguousarray(array)
+    hasher.update(str(array.shape).encode())
+    hasher.update(array.tobytes())
+
+
+def _update_with_code(hasher, code):
+    # Bytecode and constants. Lambdas and comprehensions inside the function
+    # are constants too, and their repr holds a memory address, so they are
+    # hashed the same way instead
+    hasher.update(code.co_code)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            _update_with_code(hasher, constant)
+        else:
+            hasher.update(repr(constant).encode())
+
+
+def _update_with_function(hasher, function, depth=0):
+    # Updaters and rate functions: their code plus any simple values or
+    # arrays they close over
+    hasher.update(getattr(function, "__qualname__", type(function).__name__).encode())
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return
+    _update_with_code(hasher, code)
+    for cell in function.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        _update_with_value(hasher, value, depth + 1)
+
+
+def _update_with_value(hasher, value, depth=0):
+    if depth > 3:
+        return
+    if isinstance(value, (int, float, complex, str, bool)) or value is None:
+        hasher.update(repr(value).encode())
+    elif isinstance(value, np.ndarray):
+        _update_with_array(hasher, value)
+    elif isinstance(value, Mobject):
+        hasher.update(type(value).__name__.encode())
+        _update_with_array(hasher, value.points)
+    elif callable(value):
+        _update_with_function(hasher, value, depth)
+
+
+def _update_with_updaters(hasher, mobject):
+    for updater in getattr(mobject, "updaters", []):
+        _update_with_function(hasher, updater)
+
+
+def update_with_mobject(hasher, mobject):
+    # Structural fingerprint of a mobject: type, points and style arrays of its
+    # family. Mobjects can provide get_fingerprint_arrays to hash a few
+    # meaningful arrays instead of every point of every submobject
+    if hasattr(mobject, "get_fingerprint_arrays"):
+        hasher.update(type(mobject).__name__.encode())
+        for array in mobject.get_fingerprint_arrays():
+            _update_with_array(hasher, array)
+        _update_with_updaters(hasher, mobject)
+        return
+
+    for mob in mobject.get_family():
+        hasher.update(type(mob).__name__.encode())
+        _update_with_array(hasher, mob.points)
+        for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+            if hasattr(mob, attr):
+                _update_with_array(hasher, getattr(mob, attr))
+        for attr in (
+            "stroke_width", "background_stroke_width", "sheen_factor", "sheen_direction",
+            "z_index", "shade_in_3d", "text", "tex_string",
+        ):
+            hasher.update(repr(getattr(mob, attr, None)).encode())
+        _update_with_updaters(hasher, mob)
+
+
+def update_with_camera(hasher, camera):
+    # Every plain setting of the camera (projection, light source, trackers
+    # of the angles, frame size), the part of it manim's own hash covers.
+    # Containers such as the fixed-in-frame set are left to the caller
+    for name, value in sorted(vars(camera).items()):
+        if name in UNHASHED_CAMERA_ATTRIBUTES:
+            continue
+        hasher.update(name.encode())
+        _update_with_value(hasher, value)
+
+
+def update_with_animation(hasher, animation):
+    hasher.update(type(animation).__name__.encode())
+    for attr in ("run_time", "lag_ratio", "remover", "suspend_mobject_updating"):
+        hasher.update(repr(getattr(animation, attr, None)).encode())
+    rate_func = getattr(animation, "rate_func", None)
+    if rate_func is not None:
+        _update_with_function(hasher, rate_func)
+    for attr in ("mobject", "target_mobject"):
+        mobject = getattr(animation, attr, None)
+        if isinstance(mobject, Mobject):
+            update_with_mobject(hasher, mobject)
+    for sub_animation in getattr(animation, "animations", []):
+        update_with_animation(hasher, sub_animation)
+
+
+class FingerprintCacheMixin:
+    # Keys every play() segment on a cheap structural fingerprint instead of
+    # manim's deep JSON serialization of every mobject, and keeps the partial
+    # movie files in a size-bounded LRU store. Mix in before the Scene class
+    cache_max_bytes = 2 * 1024 ** 3
+
+    def render(self, preview=False):
+        # Eviction is handled here by size, so turn off manim's file-count limit
+        max_files_cached = config.max_files_cached
+        config.max_files_cached = -1
+        original_hash = cairo_renderer.get_hash_from_play_call
+        cairo_renderer.get_hash_from_play_call = self.get_play_fingerprint
+        file_writer = self.renderer.file_writer
+        original_is_cached = file_writer.is_already_cached
+        cache = RenderCache(
+            getattr(file_writer, "partial_movie_directory", None) or ".",
+            self.cache_max_bytes,
+        )
+
+        def is_already_cached(key):
+            cached = original_is_cached(key)
+            if cached:
+                cache.touch(key)
+            return cached
+
+        file_writer.is_already_cached = is_already_cached
+        try:
+            return super().render(preview)
+        finally:
+            config.max_files_cached = max_files_cached
+            cairo_renderer.get_hash_from_play_call = original_hash
+            file_writer.is_already_cached = original_is_cached
+            if hasattr(file_writer, "partial_movie_directory"):
+                cache.evict(keep=set(getattr(self.renderer, "animations_hashes", [])))
+
+    def get_calling_scene_method(self):
+        # Name of the scene method that called play()/wait()
+        frame = inspect.currentframe()
+        while frame is not None:
+            if frame.f_locals.get("self") is self and frame.f_code.co_name not in (
+                "play", "wait", "render", "move_camera", "get_play_fingerprint",
+                "get_calling_scene_method", "profile_call",
+            ):
+                return frame.f_code.co_name
+            frame = frame.f_back
+        return ""
+
+    def get_play_fingerprint(self, scene_object, camera_object, animations_list, current_mobjects_list):
+        # Same signature as manim.utils.hashing.get_hash_from_play_call
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"v{FINGERPRINT_VERSION}".encode())
+        hasher.update(type(self).__name__.encode())
+        hasher.update(self.get_calling_scene_method().encode())
+
+        # Output settings and camera state
+        for key in ("pixel_width", "pixel_height", "frame_rate", "background_color", "background_opacity"):
+            hasher.update(repr(config[key]).encode())
+        update_with_camera(hasher, camera_object)
+        fixed_in_frame = getattr(camera_object, "fixed_in_frame_mobjects", ())
+
+        for animation in animations_list:
+            update_with_animation(hasher, animation)
+        for mobject in current_mobjects_list:
+            update_with_mobject(hasher, mobject)
+            hasher.update(b"F" if mobject in fixed_in_frame else b"-")
+        return hasher.hexdigest()
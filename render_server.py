@@ -0,0 +1,202 @@
+import argparse
+import ast
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from pathlib import Path
+
+from render_all import get_local_imports
+
+# Unix socket the server listens on and the client connects to
+RENDER_SOCKET_ENV = "MANIM_RENDER_SOCKET"
+DEFAULT_SOCKET = Path("media", "render_server.sock")
+
+# manim's quality flags and the config values they stand for
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def get_socket_path(socket_path=None):
+    return Path(socket_path or os.environ.get(RENDER_SOCKET_ENV) or DEFAULT_SOCKET)
+
+
+class ModuleReloader:
+    # Imports scene scripts and their sibling modules once, and on later jobs
+    # drops only the modules whose file changed plus the ones importing them,
+    # directly or not. Unchanged modules keep their caches (text, geometry)
+    def __init__(self):
+        # The server's own modules may sit next to the scenes, they stay put
+        self.server_modules = set(sys.modules)
+        self.loaded = {}
+
+    def get_local_modules(self, directory):
+        return {
+            name: module for name, module in sys.modules.items()
+            if name not in self.server_modules
+            and getattr(module, "__file__", None)
+            and Path(module.__file__).resolve().parent == directory
+        }
+
+    def get_stale_modules(self, directory):
+        modules = self.get_local_modules(directory)
+        stale = {
+            name for name, module in modules.items()
+            if self.loaded.get(name) != Path(module.__file__).stat().st_mtime
+        }
+        if not stale:
+            return stale
+        imports = {
+            name: get_local_imports(ast.parse(Path(module.__file__).read_text()), modules)
+            for name, module in modules.items()
+        }
+        while True:
+            dependents = {name for name in modules if imports[name] & stale} - stale
+            if not dependents:
+                return stale
+            stale |= dependents
+
+    def get_scene_class(self, script, scene_name):
+        script = Path(script).resolve()
+        directory = script.parent
+        if str(directory) not in sys.path:
+            sys.path.insert(0, str(directory))
+        for name in self.get_stale_modules(directory):
+            del sys.modules[name]
+            self.loaded.pop(name, None)
+        module = importlib.import_module(script.stem)
+        for name, local_module in self.get_local_modules(directory).items():
+            self.loaded.setdefault(name, Path(local_module.__file__).stat().st_mtime)
+        return getattr(module, scene_name)
+
+
+def render_job(reloader, job):
+    # One render with the server's warm imports. Jobs run one at a time, the
+    # manim config is global
+    from manim import tempconfig
+
+    script = Path(job["script"]).resolve()
+    scene_class = reloader.get_scene_class(script, job["scene"])
+    options = {
+        "input_file": str(script),
+        "quality": QUALITY_NAMES[job.get("quality", "l")],
+        "preview": False,
+        "write_to_movie": True,
+        **job.get("config", {}),
+    }
+    if "media_dir" in job:
+        options["media_dir"] = job["media_dir"]
+    start = time.perf_counter()
+    with tempconfig(options):
+        scene = scene_class()
+        scene.render()
+        movie = scene.renderer.file_writer.movie_file_path
+    return {"ok": True, "movie": str(Path(movie).resolve()), "seconds": time.perf_counter() - start}
+
+
+class RenderRequestHandler(socketserver.StreamRequestHandler):
+    # One JSON job per line, answered with one JSON line
+    def handle(self):
+        for line in self.rfile:
+            try:
+                job = json.loads(line)
+                if job.get("command") == "stop":
+                    response = {"ok": True}
+                    self.server.stopping = True
+                else:
+                    response = render_job(self.server.reloader, job)
+            except Exception:
+                response = {"ok": False, "error": traceback.format_exc()}
+            self.wfile.write((json.dumps(response) + "\n").encode())
+            self.wfile.flush()
+            if self.server.stopping:
+                return
+
+
+class RenderServer(socketserver.UnixStreamServer):
+    # Serves one connection at a time, so jobs never share the manim config
+    def __init__(self, socket_path):
+        self.socket_path = Path(socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        super().__init__(str(self.socket_path), RenderRequestHandler)
+        self.reloader = ModuleReloader()
+        self.stopping = False
+
+    def serve(self):
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+
+def serve(socket_path=None):
+    # Pay for manim, Cairo, Pango and the LaTeX/ffmpeg lookups once
+    import manim  # noqa: F401
+
+    socket_path = get_socket_path(socket_path)
+    server = RenderServer(socket_path)
+    print(f"Render server listening on {socket_path}", flush=True)
+    server.serve()
+
+
+def send_job(job, socket_path=None):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(get_socket_path(socket_path)))
+        with connection.makefile("rwb") as stream:
+            stream.write((json.dumps(job) + "\n").encode())
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm manim render server and its client")
+    parser.add_argument("--socket", default=None, help=f"default: ${RENDER_SOCKET_ENV} or {DEFAULT_SOCKET}")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="start the server")
+    render = commands.add_parser("render", help="render a scene on the server")
+    render.add_argument("script")
+    render.add_argument("scene")
+    render.add_argument("-q", "--quality", default="l", choices=QUALITY_NAMES)
+    render.add_argument("--media_dir", default=None)
+    render.add_argument(
+        "--config", default="{}", help='extra manim config as JSON, e.g. \'{"disable_caching": true}\''
+    )
+    commands.add_parser("stop", help="stop the server")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket)
+        return
+    if args.command == "stop":
+        send_job({"command": "stop"}, args.socket)
+        return
+    job = {
+        "script": str(Path(args.script).resolve()),
+        "scene": args.scene,
+        "quality": args.quality,
+        "config": json.loads(args.config),
+    }
+    if args.media_dir:
+        job["media_dir"] = str(Path(args.media_dir).resolve())
+    response = send_job(job, args.socket)
+    if not response["ok"]:
+        print(response["error"], file=sys.stderr)
+        sys.exit(1)
+    print(response["movie"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class GridIndex:
+    # Uniform grid hash over a fixed set of points (any dimension). Radius and
+    # nearest-neighbour queries only look at the cells around the query point
+    def __init__(self, points, cell_size=None):
+        self.points = np.array(points, dtype=float)
+        if self.points.ndim == 1:
+            self.points = self.points[:, None]
+        num_points, dimension = self.points.shape
+
+        self.origin = self.points.min(axis=0) if num_points else np.zeros(dimension)
+        extent = self.points.max(axis=0) - self.origin if num_points else np.ones(dimension)
+        if cell_size is None:
+            # Roughly one point per cell for evenly spread points
+            volume = np.prod(np.maximum(extent, 1e-9))
+            cell_size = (volume / max(num_points, 1)) ** (1 / dimension)
+        self.cell_size = float(cell_size)
+        self.shape = np.floor(extent / self.cell_size).astype(np.int64) + 1
+        self.max_radius = float(np.linalg.norm(extent)) + self.cell_size
+
+        # Bucket point indices by cell
+        keys = self._cell_keys(self._cells(self.points))
+        order = np.argsort(keys, kind="stable")
+        unique_keys, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], num_points)
+        self.buckets = {
+            key: order[start:end]
+            for key, start, end in zip(unique_keys.tolist(), starts, ends)
+        }
+
+    def __len__(self):
+        return len(self.points)
+
+    def _cells(self, points):
+        cells = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, self.shape - 1)
+
+    def _cell_keys(self, cells):
+        return np.ravel_multi_index(cells.T, self.shape)
+
+    def query_radius(self, point, radius):
+        # Indices of all points within radius of point, nearest first
+        point = np.asarray(point, dtype=float).reshape(-1)[: self.points.shape[1]]
+        low = self._cells(point - radius)
+        high = self._cells(point + radius)
+        ranges = [np.arange(lo, hi + 1) for lo, hi in zip(low, high)]
+        cells = np.stack(np.meshgrid(*ranges, indexing="ij"), axis=-1).reshape(-1, len(ranges))
+
+        buckets = [self.buckets.get(key) for key in self._cell_keys(cells).tolist()]
+        buckets = [bucket for bucket in buckets if bucket is not None]
+        if not buckets:
+            return np.zeros(0, dtype=int)
+        candidates = np.concatenate(buckets)
+
+        distances = np.linalg.norm(self.points[candidates] - point, axis=1)
+        inside = distances <= radius
+        return candidates[inside][np.argsort(distances[inside], kind="stable")]
+
+    def nearest(self, point, max_distance=None):
+        # Index of the closest point, or None if there is none within max_distance.
+        # Grows the search radius until something is found
+        if len(self) == 0:
+            return None
+        if max_distance is None:
+            max_distance = self.max_radius + np.linalg.norm(
+                np.asarray(point, dtype=float).reshape(-1)[: self.points.shape[1]] - self.origin
+            )
+        radius = min(self.cell_size, max_distance)
+        while True:
+            found = self.query_radius(point, radius)
+            if len(found):
+                return int(found[0])
+            if radius >= max_distance:
+                return None
+            radius = min(radius * 2, max_distance)
@@ -1,15 +1,104 @@
 from manim import *
 import numpy as np
-import cmath
-from colour import Color  # Add explicit import for Color
 
-class ComplexFunctionVisualization(ThreeDScene):
+from checkpoint import CheckpointSceneMixin
+from colormaps import PHASE_COLORMAP
+from complex_sampling import evaluate_complex, sample_complex_adaptive
+from contour_integration import integrate_contour
+from draft import DraftSceneMixin
+from glyphs import SphereGlyphField
+from layered_camera import LayeredCamera, LayeredSceneMixin
+from parallel_render import SectionedSceneMixin
+from path_sampling import BezierPathSampler
+from profiling import ProfiledSceneMixin
+from render_cache import FingerprintCacheMixin
+from spatial_index import GridIndex
+from streaming import StreamingSceneMixin
+from surfaces import MeshSurface
+from tex_batch import DECIMAL_TEX_CHARACTERS, TexBatchMixin
+from text_cache import TEXT_CACHE, cached_math_tex, cached_text
+
+class ComplexFunctionVisualization(
+    ProfiledSceneMixin,
+    DraftSceneMixin,
+    FingerprintCacheMixin,
+    TexBatchMixin,
+    SectionedSceneMixin,
+    CheckpointSceneMixin,
+    StreamingSceneMixin,
+    LayeredSceneMixin,
+    ThreeDScene,
+):
+    grid_size = 24
+    num_demonstrations = 2  # Use fewer functions for performance
+    integral_label_tex = r"\int_C f(z) \, dz ="
+    segment_label_tex = r"\Delta z_{{{}}}"
+    
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=LayeredCamera, **kwargs)
+    
+    def setup(self):
+        # Define complex functions to visualize with descriptions
+        functions = [
+            (lambda z: z**2, "f(z) = z²", "Simple quadratic function"),
+            (lambda z: z**3, "f(z) = z³", "Cubic function"),
+            (lambda z: 1 / z, "f(z) = 1/z", "Function with singularity at z=0"),
+        ]
+        
+        # Define integration paths with descriptions
+        paths = [
+            self.create_circular_path(center=0, radius=2, name="Circle |z| = 2", 
+                                      description="Circular path of radius 2 around origin"),
+            self.create_rectangular_path(-2, -2, 2, 2, name="Rectangle around origin", 
+                                         description="Rectangular path enclosing the origin"),
+            self.create_custom_path([(-2, -2), (2, -2), (2, 2), (0, 0), (-2, 2), (-2, -2)], 
+                                    name="Custom path", 
+                                    description="Custom path with multiple segments")
+        ]
+        
+        # Each function is demonstrated with one integration path
+        self.demonstrations = [
+            (func, func_name, func_desc, paths[i % len(paths)])
+            for i, (func, func_name, func_desc) in enumerate(functions[:self.num_demonstrations])
+        ]
+        # Final integral of every demonstration so far, part of the checkpoint state
+        self.integral_results = []
+        super().setup()
+    
+    def get_tex_strings(self):
+        # Every MathTex the scene builds, so they compile in a single LaTeX run
+        tex_strings = [self.integral_label_tex, *DECIMAL_TEX_CHARACTERS]
+        for func, func_name, func_desc, (path, path_name, path_desc) in self.demonstrations:
+            sample = self.sample_function(func)
+            preview_index = self.get_preview_index(sample)
+            if preview_index is not None:
+                tex_strings.append(self.get_preview_tex(sample, preview_index))
+            integral_values = self.integrate_along_path(func, path)[2]
+            tex_strings += [self.get_segment_label_tex(i) for i in range(1, len(integral_values))]
+            tex_strings.append(self.get_result_tex(integral_values[-1]))
+        return tex_strings
+    
+    def get_checkpoint_state(self):
+        state = super().get_checkpoint_state()
+        state["integrals"] = [[value.real, value.imag] for value in self.integral_results]
+        return state
+    
+    @classmethod
+    def get_section_names(cls):
+        # Every section starts with the title, axes and legend on screen,
+        # so they can be rendered independently
+        return [
+            "introduction",
+            *(f"demonstration_{i + 1}" for i in range(cls.num_demonstrations)),
+            "closing",
+        ]
+    
     def construct(self):
-        # Disable caching to improve performance with many objects
-        config.disable_caching = True
+        introduction, *demonstration_sections, closing = self.get_section_names()
+        self.next_section(introduction)
         
         # Title for the visualization
-        title = Text("Complex Function Integration Visualization", font_size=42).to_edge(UP)
+        title = cached_text("Complex Function Integration Visualization", font_size=42).to_edge(UP)
         self.add_fixed_in_frame_mobjects(title)
         self.play(Write(title))
         
@@ -20,7 +109,7 @@ class ComplexFunctionVisualization(ThreeDScene):
         self.setup_axes()
         
         # Introduction text
-        intro_text = Text(
+        intro_text = cached_text(
             "Visualizing complex functions and their integration paths in 3D space",
             font_size=24
         ).next_to(title, DOWN)
@@ -31,35 +120,19 @@ class ComplexFunctionVisualization(ThreeDScene):
         # Remove intro text after showing it
         self.play(FadeOut(intro_text))
         
-        # Define complex functions to visualize with descriptions
-        functions = [
-            (lambda z: z**2, "f(z) = z²", "Simple quadratic function"),
-            (lambda z: z**3, "f(z) = z³", "Cubic function"),
-            (lambda z: 1/z if z != 0 else float('inf'), "f(z) = 1/z", "Function with singularity at z=0"),
-        ]
-        
-        # Define integration paths with descriptions
-        paths = [
-            self.create_circular_path(center=0, radius=2, name="Circle |z| = 2", 
-                                      description="Circular path of radius 2 around origin"),
-            self.create_rectangular_path(-2, -2, 2, 2, name="Rectangle around origin", 
-                                         description="Rectangular path enclosing the origin"),
-            self.create_custom_path([(-2, -2), (2, -2), (2, 2), (0, 0), (-2, 2), (-2, -2)], 
-                                    name="Custom path", 
-                                    description="Custom path with multiple segments")
-        ]
-        
         # Legend for color interpretation
         self.show_color_legend()
         
         # Visualize each function with integration paths
-        for func, func_name, func_desc in functions[:2]:  # Use fewer functions for performance
+        for section, (func, func_name, func_desc, path_tuple) in zip(demonstration_sections, self.demonstrations):
+            self.next_section(section)
+            
             # Create and show the complex function visualization
             surface, grid_spheres = self.visualize_complex_function(func, func_name)
             
             # Show function name and description
-            func_text = Text(func_name, font_size=36).to_corner(UL)
-            func_desc_text = Text(func_desc, font_size=24).next_to(func_text, DOWN).to_edge(LEFT)
+            func_text = cached_text(func_name, font_size=36).to_corner(UL)
+            func_desc_text = cached_text(func_desc, font_size=24).next_to(func_text, DOWN).to_edge(LEFT)
             self.add_fixed_in_frame_mobjects(func_text, func_desc_text)
             
             # Animation to display the function
@@ -71,11 +144,11 @@ class ComplexFunctionVisualization(ThreeDScene):
             )
             
             # Add explanatory text about the visualization
-            viz_explanation = Text(
+            viz_explanation = cached_text(
                 "Height (z-axis) = |f(z)| (magnitude)",
                 font_size=20
             ).to_edge(DOWN).shift(UP * 0.5)
-            color_explanation = Text(
+            color_explanation = cached_text(
                 "Color = arg(f(z)) (phase)",
                 font_size=20
             ).next_to(viz_explanation, DOWN)
@@ -88,8 +161,7 @@ class ComplexFunctionVisualization(ThreeDScene):
             self.wait(1)
             
             # For each function, demonstrate at least one integration path
-            path_idx = functions.index((func, func_name, func_desc)) % len(paths)
-            path, path_name, path_desc = paths[path_idx]
+            path, path_name, path_desc = path_tuple
             
             # Remove previous explanations
             self.play(
@@ -98,8 +170,8 @@ class ComplexFunctionVisualization(ThreeDScene):
             )
             
             # Show path name and description
-            path_text = Text(f"Path: {path_name}", font_size=28).next_to(func_desc_text, DOWN).to_edge(LEFT)
-            path_desc_text = Text(path_desc, font_size=20).next_to(path_text, DOWN).to_edge(LEFT)
+            path_text = cached_text(f"Path: {path_name}", font_size=28).next_to(func_desc_text, DOWN).to_edge(LEFT)
+            path_desc_text = cached_text(path_desc, font_size=20).next_to(path_text, DOWN).to_edge(LEFT)
             self.add_fixed_in_frame_mobjects(path_text, path_desc_text)
             self.play(
                 Write(path_text),
@@ -107,7 +179,7 @@ class ComplexFunctionVisualization(ThreeDScene):
             )
             
             # Explanation of integration
-            integration_explanation = Text(
+            integration_explanation = cached_text(
                 "Integrating along the path: watch the accumulation",
                 font_size=24
             ).to_edge(DOWN).shift(UP * 0.5)
@@ -115,17 +187,17 @@ class ComplexFunctionVisualization(ThreeDScene):
             self.play(Write(integration_explanation))
             
             # Visualize integration with educational elements
-            result_text = self.visualize_integration_educational(func, path, grid_spheres)
+            result_text = self.visualize_integration_educational(func, path_tuple, grid_spheres)
             self.add_fixed_in_frame_mobjects(result_text)
             
             # Add explanation of the result
             if abs(complex(result_text.tex_string.split("=")[1])) < 0.5:
-                result_explanation = Text(
+                result_explanation = cached_text(
                     "Result ≈ 0: Confirms Cauchy's Integral Theorem for analytic functions",
                     font_size=20
                 ).to_edge(DOWN)
             else:
-                result_explanation = Text(
+                result_explanation = cached_text(
                     "Non-zero result: Path encloses singularities or branch points",
                     font_size=20
                 ).to_edge(DOWN)
@@ -134,7 +206,7 @@ class ComplexFunctionVisualization(ThreeDScene):
             self.play(Write(result_explanation))
             
             # Move camera to view the scene from different angles with explanation
-            camera_move_text = Text(
+            camera_move_text = cached_text(
                 "Moving camera to view from different angle",
                 font_size=24
             ).to_edge(DOWN)
@@ -165,8 +237,9 @@ class ComplexFunctionVisualization(ThreeDScene):
             )
         
         # Closing title
-        closing_title = Text("Complex Analysis: Visualizing Integration", font_size=42).to_edge(UP)
-        closing_text = Text(
+        self.next_section(closing)
+        closing_title = cached_text("Complex Analysis: Visualizing Integration", font_size=42).to_edge(UP)
+        closing_text = cached_text(
             "Complex integration is a powerful tool in mathematics and physics",
             font_size=24
         ).next_to(closing_title, DOWN)
@@ -177,20 +250,23 @@ class ComplexFunctionVisualization(ThreeDScene):
             Write(closing_text)
         )
         self.wait(2)
+        
+        # Report how much typesetting the label cache saved
+        logger.info(TEXT_CACHE.describe())
     
     def show_color_legend(self):
         # Create a color legend to explain phase mapping
-        legend_title = Text("Color Legend: Phase Mapping", font_size=24).to_corner(UR)
+        legend_title = cached_text("Color Legend: Phase Mapping", font_size=24).to_corner(UR)
         
         # Create a color wheel for the legend
         radius = 0.3
         color_wheel = VGroup()
         num_segments = 12
-        for i in range(num_segments):
+        # Wedge colors come from the same phase colormap as the spheres and surface
+        wedge_phases = (np.arange(num_segments) + 0.5) * 2 * PI / num_segments - PI
+        wedge_colors = self.phase_to_color(wedge_phases)
+        for i, color in enumerate(wedge_colors):
             angle_start = i * 2 * PI / num_segments
-            angle_end = (i + 1) * 2 * PI / num_segments
-            phase = (angle_start + angle_end) / 2 - PI
-            color = self.phase_to_color(phase)
             
             segment = AnnularSector(
                 inner_radius=0,
@@ -208,7 +284,7 @@ class ComplexFunctionVisualization(ThreeDScene):
         label_texts = ["0", "π/2", "π", "3π/2"]
         
         for angle, text in zip(label_points, label_texts):
-            label = Text(text, font_size=16)
+            label = cached_text(text, font_size=16)
             label.move_to(radius * 1.3 * np.array([np.cos(angle), np.sin(angle), 0]))
             phase_labels.add(label)
         
@@ -236,9 +312,9 @@ class ComplexFunctionVisualization(ThreeDScene):
         )
         
         # Labels with more descriptive text - moved to fixed frame (2D) positions
-        x_label = Text("Real Axis (Re(z))", font_size=24).to_corner(DR).shift(UP * 1.5 + LEFT * 3)
-        y_label = Text("Imaginary Axis (Im(z))", font_size=24).to_corner(DL).shift(UP * 1.5 + RIGHT * 3)
-        z_label = Text("Magnitude (|f(z)|)", font_size=24).to_corner(UL).shift(DOWN * 1.5 + RIGHT * 3)
+        x_label = cached_text("Real Axis (Re(z))", font_size=24).to_corner(DR).shift(UP * 1.5 + LEFT * 3)
+        y_label = cached_text("Imaginary Axis (Im(z))", font_size=24).to_corner(DL).shift(UP * 1.5 + RIGHT * 3)
+        z_label = cached_text("Magnitude (|f(z)|)", font_size=24).to_corner(UL).shift(DOWN * 1.5 + RIGHT * 3)
         
         # Add a complex plane (xy-plane) with grid lines
         complex_plane = NumberPlane(
@@ -256,7 +332,7 @@ class ComplexFunctionVisualization(ThreeDScene):
         self.add_fixed_in_frame_mobjects(x_label, y_label, z_label)
         
         # Add explanatory text about the coordinate system
-        coord_explanation = Text(
+        coord_explanation = cached_text(
             "The complex plane is represented by the x-y plane",
             font_size=24
         ).to_edge(DOWN)
@@ -266,143 +342,138 @@ class ComplexFunctionVisualization(ThreeDScene):
         self.wait(1)
         self.play(FadeOut(coord_explanation))
     
+    def sample_function(self, func):
+        # Adaptive quadtree over [-3, 3]², with as many evaluations as the
+        # old uniform grid_size × grid_size grid but packed around poles and
+        # branch cuts
+        return sample_complex_adaptive(func, (-3, 3), (-3, 3), max_samples=self.grid_size ** 2)
+    
+    def get_preview_index(self, sample):
+        # For visualization, show the first valid sample. The coarse starting
+        # grid comes first, so this is a corner of the domain unless f is
+        # undefined there
+        preview_indices = np.flatnonzero(sample.valid)
+        if len(preview_indices) == 0:
+            return None
+        return int(preview_indices[0])
+    
+    def get_preview_tex(self, sample, preview_index):
+        x = sample.x[preview_index]
+        y = sample.y[preview_index]
+        w = sample.values[preview_index]
+        return f"f({x:.1f} + {y:.1f}i) = {w.real:.1f} + {w.imag:.1f}i"
+    
+    def get_segment_label_tex(self, step):
+        return self.segment_label_tex.format(step)
+    
+    def get_result_tex(self, integral_value):
+        return r"\oint_C f(z) \, dz = " + f"{integral_value:.2f}"
+    
     def visualize_complex_function(self, func, func_name):
-        # Parameters for the grid - REDUCED for better performance
-        grid_size = 12  # Reduced from 20
-        x_range = np.linspace(-3, 3, grid_size)
-        y_range = np.linspace(-3, 3, grid_size)
-        sphere_radius = 0.08  # Slightly larger for better visibility with fewer points
-        
-        # Create a group for the spheres
-        grid_spheres = VGroup()
-        
-        # Create surface points for the function
-        surface_points = []
+        # Largest marker, they shrink with the quadtree cells
+        sphere_radius = 0.06
         
         # Animation to show building the surface point by point
-        building_text = Text("Building the complex function visualization...", font_size=24).to_edge(DOWN)
+        building_text = cached_text("Building the complex function visualization...", font_size=24).to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(building_text)
         self.play(Write(building_text))
         
-        # Create preview sphere to demonstrate what we're doing
-        preview_sphere = None
-        preview_position = None
-        
-        # Sample points to create the surface
-        for x_idx, x in enumerate(x_range):
-            row_points = []
-            for y_idx, y in enumerate(y_range):
-                z = complex(x, y)
-                try:
-                    w = func(z)
-                    # If w is infinity or NaN, skip this point
-                    if w == float('inf') or w != w:
-                        continue
-                    
-                    # Extract magnitude and phase
-                    magnitude = abs(w)
-                    phase = cmath.phase(w)
-                    
-                    # Cap extremely large values
-                    if magnitude > 5:
-                        magnitude = 5
-                    
-                    # Color based on phase (hue)
-                    color = self.phase_to_color(phase)
-                    
-                    # Create sphere at (x, y, |w|)
-                    sphere = Sphere(
-                        radius=sphere_radius,
-                        fill_opacity=0.8,
-                        color=color,
-                        resolution=(8, 8)  # Lower resolution for better performance
-                    ).move_to(np.array([x, y, magnitude]))
-                    
-                    # For visualization, show a few spheres being placed
-                    if preview_sphere is None and x_idx % 3 == 0 and y_idx % 3 == 0:
-                        preview_sphere = sphere.copy()
-                        preview_position = np.array([x, y, magnitude])
-                        preview_text = MathTex(
-                            f"f({x:.1f} + {y:.1f}i) = {w.real:.1f} + {w.imag:.1f}i",
-                            font_size=24
-                        ).to_edge(DOWN).shift(UP * 0.5)
-                        magnitude_text = Text(
-                            f"|f(z)| = {magnitude:.2f}, arg(f(z)) = {phase:.2f}",
-                            font_size=20
-                        ).next_to(preview_text, DOWN)
-                        
-                        self.add_fixed_in_frame_mobjects(preview_text, magnitude_text)
-                        self.play(
-                            FadeOut(building_text),
-                            FadeIn(preview_sphere),
-                            Write(preview_text),
-                            Write(magnitude_text)
-                        )
-                        
-                        # Show connection between complex plane and height
-                        plane_dot = Dot(np.array([x, y, 0]), color=RED)
-                        height_line = Line(
-                            np.array([x, y, 0]),
-                            np.array([x, y, magnitude]),
-                            color=YELLOW
-                        )
-                        self.play(
-                            FadeIn(plane_dot),
-                            Create(height_line)
-                        )
-                        self.wait(1)
-                        self.play(
-                            FadeOut(plane_dot),
-                            FadeOut(height_line),
-                            FadeOut(preview_text),
-                            FadeOut(magnitude_text),
-                            FadeOut(preview_sphere)
-                        )
-                    
-                    grid_spheres.add(sphere)
-                    row_points.append([x, y, magnitude])
-                except:
-                    # Skip points where function cannot be evaluated
-                    pass
-            if row_points:
-                surface_points.append(row_points)
-        
-        # Create a surface
-        surface = None
-        if len(surface_points) > 1 and all(len(row) > 1 for row in surface_points):
-            # Ensure we have enough points with consistent row lengths
-            min_row_length = min(len(row) for row in surface_points)
-            surface_points = [row[:min_row_length] for row in surface_points]
+        sample = self.sample_function(func)
+        preview_index = self.get_preview_index(sample)
+        
+        # One glyph per valid sample, all sharing the same sphere mesh. Markers
+        # shrink where the cells do, so they do not overlap around poles
+        grid_spheres = SphereGlyphField(
+            np.stack([
+                sample.x[sample.valid],
+                sample.y[sample.valid],
+                sample.magnitude[sample.valid],
+            ], axis=-1),
+            radii=np.minimum(sphere_radius, 0.4 * sample.cell_size[sample.valid]),
+            colors=sample.colors[sample.valid],
+            fill_opacity=0.8
+        )
+        
+        # The point-by-point preview is narrative only, drafts skip it
+        if preview_index is not None and not self.is_draft():
+            x = sample.x[preview_index]
+            y = sample.y[preview_index]
+            magnitude = sample.magnitude[preview_index]
+            phase = sample.phase[preview_index]
             
-            # Create the surface with appropriate coloring
-            surface = Surface(
-                lambda u, v: np.array([
-                    surface_points[int(u * (len(surface_points) - 1))][int(v * (min_row_length - 1))][0],
-                    surface_points[int(u * (len(surface_points) - 1))][int(v * (min_row_length - 1))][1],
-                    surface_points[int(u * (len(surface_points) - 1))][int(v * (min_row_length - 1))][2]
-                ]),
-                u_range=[0, 1],
-                v_range=[0, 1],
-                resolution=(len(surface_points), min_row_length),
-                fill_opacity=0.6,
-                stroke_opacity=0.4,
-                stroke_width=0.5,
+            # Glyphs are stored in the same order as the valid samples
+            glyph_index = int(np.count_nonzero(sample.valid[:preview_index]))
+            preview_sphere = grid_spheres[glyph_index].copy()
+            preview_text = cached_math_tex(
+                self.get_preview_tex(sample, preview_index),
+                font_size=24
+            ).to_edge(DOWN).shift(UP * 0.5)
+            magnitude_text = cached_text(
+                f"|f(z)| = {magnitude:.2f}, arg(f(z)) = {phase:.2f}",
+                font_size=20
+            ).next_to(preview_text, DOWN)
+            
+            self.add_fixed_in_frame_mobjects(preview_text, magnitude_text)
+            self.play(
+                FadeOut(building_text),
+                FadeIn(preview_sphere),
+                Write(preview_text),
+                Write(magnitude_text)
             )
             
-            # Apply color gradient based on height
-            surface.set_fill_by_value(
-                axes=ThreeDAxes(),
-                colors=[(BLUE_E, -1), (GREEN, 0), (YELLOW, 2), (RED, 4)],
-                axis=2
+            # Show connection between complex plane and height
+            plane_dot = Dot(np.array([x, y, 0]), color=RED)
+            height_line = Line(
+                np.array([x, y, 0]),
+                np.array([x, y, magnitude]),
+                color=YELLOW
             )
+            self.play(
+                FadeIn(plane_dot),
+                Create(height_line)
+            )
+            self.wait(1)
+            self.play(
+                FadeOut(plane_dot),
+                FadeOut(height_line),
+                FadeOut(preview_text),
+                FadeOut(magnitude_text),
+                FadeOut(preview_sphere)
+            )
+        else:
+            self.play(FadeOut(building_text))
+        
+        # Build the surface straight from the quadtree cells. Cells touching
+        # an invalid sample are already left out, so poles become holes
+        vertices = np.stack([
+            sample.x,
+            sample.y,
+            np.where(sample.valid, sample.magnitude, 0),
+        ], axis=-1)
+        surface = MeshSurface.from_mesh(
+            vertices,
+            sample.faces,
+            fill_opacity=0.6,
+            stroke_opacity=0.4,
+            stroke_width=0.5,
+        )
+        
+        # Color every face by the phase of f at its center, like the spheres.
+        # A center can land on a singularity the corners straddle, give it phase 0
+        face_centers = surface.get_face_centers()
+        with np.errstate(all="ignore"):
+            face_phases = np.angle(evaluate_complex(func, face_centers[:, 0] + 1j * face_centers[:, 1]))
+        surface.set_face_colors(PHASE_COLORMAP.get_rgb(np.nan_to_num(face_phases)))
+        if len(surface) == 0:
+            surface = None
         
         return surface, grid_spheres
     
     def phase_to_color(self, phase):
-        # Convert phase to color using HSL color space
-        # Map phase from [-π, π] to [0, 1] for hue
-        hue = (phase + np.pi) / (2 * np.pi)
-        return Color(hsl=(hue, 0.8, 0.6))
+        # Convert phase (a number or an array) to color with the shared hue table
+        if np.ndim(phase) == 0:
+            return PHASE_COLORMAP.get_colors([phase])[0]
+        return PHASE_COLORMAP.get_colors(phase)
     
     def create_circular_path(self, center=0, radius=1, name="Circle", description=""):
         # Create a circular path in the complex plane
@@ -439,11 +510,25 @@ class ComplexFunctionVisualization(ThreeDScene):
         
         return path, name, description
     
-    def visualize_integration_educational(self, func, path_tuple, grid_spheres):
+    def integrate_along_path(self, func, path, num_steps=24):
+        # Discretize the path at evenly spaced points along the curve (plus its corners).
+        # Accuracy comes from the quadrature rule, so num_steps only sets the animation pace
+        path_sampler = BezierPathSampler(path)
+        path_sample = path_sampler.sample(num_steps, include_corners=True)
+        integral_values = integrate_contour(
+            func,
+            path_sample.z,
+            rule="gauss",
+            path=path_sampler,
+            t=path_sample.t,
+        ).cumulative
+        return path_sampler, path_sample, integral_values
+    
+    def visualize_integration_educational(self, func, path_tuple, grid_spheres, num_steps=24):
         path, path_name, path_desc = path_tuple
         
         # Show the path with explanation
-        path_explanation = Text(
+        path_explanation = cached_text(
             "This path defines our contour of integration", 
             font_size=20
         ).to_edge(DOWN)
@@ -456,8 +541,8 @@ class ComplexFunctionVisualization(ThreeDScene):
         self.wait(1)
         
         # Create a dot to move along the path
-        moving_dot = Sphere(radius=0.1, color=YELLOW, resolution=(8, 8)).move_to(path.get_start())
-        dot_explanation = Text(
+        moving_dot = SphereGlyphField([path.get_start()], radii=0.1, colors=YELLOW)
+        dot_explanation = cached_text(
             "The yellow sphere moves along the integration path", 
             font_size=20
         ).next_to(path_explanation, DOWN)
@@ -469,14 +554,16 @@ class ComplexFunctionVisualization(ThreeDScene):
             FadeOut(path_explanation)
         )
         
-        # Initialize integral value
-        integral_value = 0
-        integral_text = MathTex(
-            r"\int_C f(z) \, dz = 0",
+        # Running integral readout, the number is updated during the walk
+        integral_label = cached_math_tex(self.integral_label_tex, font_size=32)
+        integral_readout = DecimalNumber(
+            0j,
+            num_decimal_places=2,
             font_size=32
-        ).to_corner(UR)
+        ).next_to(integral_label, RIGHT)
+        integral_text = VGroup(integral_label, integral_readout).to_corner(UR)
         
-        integral_explanation = Text(
+        integral_explanation = cached_text(
             "The integral accumulates as we move along the path",
             font_size=20
         ).next_to(dot_explanation, DOWN)
@@ -493,10 +580,10 @@ class ComplexFunctionVisualization(ThreeDScene):
             FadeOut(integral_explanation)
         )
         
-        # Discretize the path for integration
-        points = path.get_points()
-        # Take fewer points for better performance
-        path_points = [points[i] for i in range(0, len(points), 6)]  # Increased step from 3 to 6
+        # Discretize the path and calculate the integral up front, without
+        # animation, to avoid lag
+        path_sampler, path_sample, integral_values = self.integrate_along_path(func, path, num_steps)
+        path_points = path_sample.points
         
         # Add dots to show the discretization
         discretization_dots = VGroup()
@@ -504,7 +591,7 @@ class ComplexFunctionVisualization(ThreeDScene):
             dot = Dot(point, color=BLUE, radius=0.05)
             discretization_dots.add(dot)
         
-        discretization_explanation = Text(
+        discretization_explanation = cached_text(
             "We discretize the path into small segments for numerical integration",
             font_size=20
         ).to_edge(DOWN)
@@ -521,136 +608,140 @@ class ComplexFunctionVisualization(ThreeDScene):
             FadeOut(discretization_explanation)
         )
         
-        # Add trapezoidal rule explanation
-        trap_explanation = Text(
-            "Using the trapezoidal rule: ∫f(z)dz ≈ Σ[f(z₁) + f(z₂)]/2 · Δz",
+        # Add quadrature rule explanation
+        quadrature_explanation = cached_text(
+            "Using Gauss-Legendre quadrature on each segment: ∫f(z)dz ≈ Σ wₖ f(z(tₖ)) z'(tₖ) Δt",
             font_size=20
         ).to_edge(DOWN)
-        self.add_fixed_in_frame_mobjects(trap_explanation)
+        self.add_fixed_in_frame_mobjects(quadrature_explanation)
         
-        self.play(Write(trap_explanation))
+        self.play(Write(quadrature_explanation))
         self.wait(1)
         
-        # Calculate integral value first without animation to avoid lag
-        integral_values = [0]
-        
-        for i in range(1, len(path_points)):
-            current_point = path_points[i-1]
-            next_point = path_points[i]
-            
-            z1 = complex(current_point[0], current_point[1])
-            z2 = complex(next_point[0], next_point[1])
-            
-            dz = z2 - z1
-            try:
-                f_z1 = func(z1) if z1 != 0 or "1/z" not in str(func) else float('inf')
-                f_z2 = func(z2) if z2 != 0 or "1/z" not in str(func) else float('inf')
-                
-                if f_z1 != float('inf') and f_z2 != float('inf'):
-                    segment_integral = 0.5 * (f_z1 + f_z2) * dz
-                    integral_values.append(integral_values[-1] + segment_integral)
-                else:
-                    integral_values.append(integral_values[-1])
-            except:
-                integral_values.append(integral_values[-1])
-        
-        # Remove trapezoidal rule explanation
-        self.play(FadeOut(trap_explanation))
+        # Remove quadrature rule explanation
+        self.play(FadeOut(quadrature_explanation))
         
         # Now animate with pre-calculated values
-        progress_explanation = Text(
+        progress_explanation = cached_text(
             "Watching the integral accumulate as we travel along the path",
             font_size=20
         ).to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(progress_explanation)
         self.play(Write(progress_explanation))
         
-        # Keep track of any active point contribution text
-        active_point_contribution = None
-        
-        for i in range(1, len(path_points)):
-            # Get current and next point
-            current_point = path_points[i-1]
+        # Spatial index over the grid spheres in the complex plane
+        sphere_index = GridIndex(grid_spheres.positions[:, :2])
+        
+        # The whole walk is a single animation: a tracker runs over the node
+        # indices and everything else reads the precomputed arrays from it
+        step_time = 0.5
+        num_nodes = len(path_points)
+        walk_time = step_time * (num_nodes - 1)
+        node_indices = np.arange(num_nodes)
+        walk = ValueTracker(0)
+        
+        def get_walk_point():
+            t = np.interp(walk.get_value(), node_indices, path_sample.t)
+            z = path_sampler(t)[0]
+            return np.array([z.real, z.imag, path_points[0][2]])
+        
+        def get_walk_step():
+            # Index of the node the current step starts from
+            return min(int(walk.get_value()), num_nodes - 2)
+        
+        def get_walk_segment_start():
+            return path_points[get_walk_step()]
+        
+        # Marker, trailing segment of the current step and its label
+        moving_dot.add_updater(lambda m: m.move_to(get_walk_point()))
+        segment = VMobject(color=YELLOW, stroke_width=5)
+        segment.set_points_as_corners([path_points[0], path_points[0]])
+        segment.add_updater(
+            lambda m: m.set_points_as_corners([get_walk_segment_start(), get_walk_point()])
+        )
+        segment_labels = [
+            cached_math_tex(self.get_segment_label_tex(i), font_size=16)
+            for i in range(1, num_nodes)
+        ]
+        segment_label = VGroup(segment_labels[0])
+        
+        def update_segment_label(label):
+            step_label = segment_labels[get_walk_step()]
+            if label.submobjects[0] is not step_label:
+                label.submobjects = [step_label]
+            label.next_to(segment, UP, buff=0.1)
+        
+        segment_label.add_updater(update_segment_label)
+        
+        # The readout follows the cumulative integral. It is fixed in frame once
+        # with integral_text, but DecimalNumber replaces its digits on every
+        # set_value, so the camera trades the old digits for the new ones
+        camera = self.renderer.camera
+        
+        def update_readout(readout):
+            old_digits = readout.submobjects
+            readout.set_value(complex(
+                np.interp(walk.get_value(), node_indices, integral_values.real)
+                + 1j * np.interp(walk.get_value(), node_indices, integral_values.imag)
+            ))
+            camera.remove_fixed_in_frame_mobjects(*old_digits)
+            camera.add_fixed_in_frame_mobjects(*readout.submobjects)
+        
+        integral_readout.add_updater(update_readout)
+        
+        # Highlight the nearest grid sphere on every other node, timed to the
+        # moment the marker arrives there
+        highlights = []
+        for i in range(2, num_nodes, 2):
             next_point = path_points[i]
-            integral_value = integral_values[i]
-            
-            # Create the segment for this step
-            segment = Line(current_point, next_point, color=YELLOW, stroke_width=5)
-            segment_label = MathTex(r"\Delta z_{" + str(i) + "}", font_size=16).next_to(segment, UP, buff=0.1)
-            
-            # Update moving dot
-            self.play(
-                Create(segment),
-                Write(segment_label),
-                moving_dot.animate.move_to(next_point),
-                run_time=0.5
-            )
-            
-            # Only highlight a few spheres to improve performance
-            if i % 2 == 0:  # Only highlight every other point
-                highlighted = False
-                # Limit number of spheres to check
-                for sphere in grid_spheres[:30]:  # Check only first 30 spheres
-                    sphere_pos = sphere.get_center()
-                    distance = np.sqrt((sphere_pos[0] - next_point[0])**2 + (sphere_pos[1] - next_point[1])**2)
-                    if distance < 0.5:
-                        # Highlight the sphere and show its value
-                        z_val = complex(next_point[0], next_point[1])
-                        try:
-                            w_val = func(z_val)
-                            if w_val != float('inf') and w_val == w_val:
-                                # Clean up previous contribution text if it exists
-                                if active_point_contribution:
-                                    self.play(FadeOut(active_point_contribution), run_time=0.1)
-                                
-                                point_contribution = Text(
-                                    f"f({z_val.real:.1f} + {z_val.imag:.1f}i) contributes",
-                                    font_size=16
-                                ).next_to(progress_explanation, DOWN)
-                                active_point_contribution = point_contribution
-                                
-                                self.add_fixed_in_frame_mobjects(point_contribution)
-                                
-                                self.play(
-                                    Flash(sphere, color=WHITE, flash_radius=0.2, line_length=0.1),
-                                    Write(point_contribution),
-                                    run_time=0.3
-                                )
-                                highlighted = True
-                                break  # Just highlight one sphere at each step
-                        except:
-                            pass
-                
-                # Update integral text, but less frequently
-                if highlighted or i % 4 == 0:
-                    new_integral_text = MathTex(
-                        r"\int_C f(z) \, dz = " + f"{integral_value:.2f}",
-                        font_size=32
-                    ).to_corner(UR)
-                    self.play(
-                        ReplacementTransform(integral_text, new_integral_text),
-                        run_time=0.3
-                    )
-                    integral_text = new_integral_text
-            
-            # Clean up segment after we're done with it
-            self.play(
-                FadeOut(segment),
-                FadeOut(segment_label),
-                run_time=0.2
-            )
+            sphere_idx = sphere_index.nearest(next_point[:2], max_distance=0.5)
+            z_val = complex(next_point[0], next_point[1])
+            if sphere_idx is not None and np.isfinite(evaluate_complex(func, z_val)):
+                highlights.append((i, grid_spheres[sphere_idx], z_val))
+        
+        highlight_animations = []
+        for h, (i, sphere, z_val) in enumerate(highlights):
+            arrival = i * step_time
+            leave = highlights[h + 1][0] * step_time if h + 1 < len(highlights) else walk_time
+            point_contribution = cached_text(
+                f"f({z_val.real:.1f} + {z_val.imag:.1f}i) contributes",
+                font_size=16
+            ).next_to(progress_explanation, DOWN)
+            self.renderer.camera.add_fixed_in_frame_mobjects(point_contribution)
+            highlight_animations.append(Succession(
+                Wait(run_time=arrival),
+                Flash(sphere, color=WHITE, flash_radius=0.2, line_length=0.1, run_time=0.3)
+            ))
+            highlight_animations.append(Succession(
+                Wait(run_time=arrival),
+                FadeIn(point_contribution, run_time=0.1),
+                Wait(run_time=max(leave - arrival - 0.2, 0.01)),
+                FadeOut(point_contribution, run_time=0.1)
+            ))
+        
+        self.add(segment, segment_label)
+        self.play(
+            walk.animate(run_time=walk_time, rate_func=linear).set_value(num_nodes - 1),
+            *highlight_animations
+        )
         
-        # Clean up any remaining point contribution text
-        if active_point_contribution:
-            self.play(FadeOut(active_point_contribution), run_time=0.1)
+        for mobject in (moving_dot, segment, segment_label, integral_readout):
+            mobject.clear_updaters()
+        self.play(
+            FadeOut(segment),
+            FadeOut(segment_label),
+            run_time=0.2
+        )
+        integral_value = integral_values[-1]
+        self.integral_results.append(integral_value)
         
         # Final result with educational explanation
-        final_result = MathTex(
-            r"\oint_C f(z) \, dz = " + f"{integral_value:.2f}",
+        final_result = cached_math_tex(
+            self.get_result_tex(integral_value),
             font_size=36
         ).to_corner(DR)
         
-        final_explanation = Text(
+        final_explanation = cached_text(
             "The symbol ∮ indicates integration around a closed curve",
             font_size=20
         ).to_edge(DOWN)
@@ -664,7 +755,7 @@ class ComplexFunctionVisualization(ThreeDScene):
         
         # If integral is close to zero, explain Cauchy's theorem
         if abs(integral_value) < 0.5:
-            cauchy_explanation = Text(
+            cauchy_explanation = cached_text(
                 "Result ≈ 0: Consistent with Cauchy's Integral Theorem!",
                 font_size=24,
                 color=GREEN
@@ -678,7 +769,7 @@ class ComplexFunctionVisualization(ThreeDScene):
             )
         else:
             # It's probably the 1/z function
-            residue_explanation = Text(
+            residue_explanation = cached_text(
                 "Non-zero result: Path encircles a singularity (pole)",
                 font_size=24,
                 color=YELLOW
@@ -697,18 +788,25 @@ class ComplexFunctionVisualization(ThreeDScene):
         return final_result
 
 
-class CubeOfSpheres(ThreeDScene):
+class CubeOfSpheres(
+    ProfiledSceneMixin,
+    DraftSceneMixin,
+    FingerprintCacheMixin,
+    StreamingSceneMixin,
+    LayeredSceneMixin,
+    ThreeDScene,
+):
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=LayeredCamera, **kwargs)
+    
     def construct(self):
-        # Disable caching to improve performance with many objects
-        config.disable_caching = True
-        
         # Add title
-        title = Text("3D Cube of Spheres Visualization", font_size=42).to_edge(UP)
+        title = cached_text("3D Cube of Spheres Visualization", font_size=42).to_edge(UP)
         self.add_fixed_in_frame_mobjects(title)
         self.play(Write(title))
         
         # Add description
-        description = Text(
+        description = cached_text(
             "A simple 3D arrangement of spheres in a cubic lattice",
             font_size=24
         ).next_to(title, DOWN)
@@ -720,7 +818,6 @@ class CubeOfSpheres(ThreeDScene):
         num_spheres_side = 4  # Reduced from 5
         cube_side = 3
         sphere_radius = cube_side/(num_spheres_side * 3)
-        spheres = VGroup()
 
         # Show axes for reference
         axes = ThreeDAxes(
@@ -730,45 +827,35 @@ class CubeOfSpheres(ThreeDScene):
         )
         
         # Move labels to fixed frame positions to avoid overlapping
-        x_label = Text("X", font_size=24).to_corner(DR).shift(UP * 1.5 + LEFT * 3)
-        y_label = Text("Y", font_size=24).to_corner(DL).shift(UP * 1.5 + RIGHT * 3)
-        z_label = Text("Z", font_size=24).to_corner(UL).shift(DOWN * 1.5 + RIGHT * 3)
+        x_label = cached_text("X", font_size=24).to_corner(DR).shift(UP * 1.5 + LEFT * 3)
+        y_label = cached_text("Y", font_size=24).to_corner(DL).shift(UP * 1.5 + RIGHT * 3)
+        z_label = cached_text("Z", font_size=24).to_corner(UL).shift(DOWN * 1.5 + RIGHT * 3)
         
         self.add(axes)
         self.add_fixed_in_frame_mobjects(x_label, y_label, z_label)
         
         # Create and add spheres with educational explanation
-        building_text = Text(
+        building_text = cached_text(
             "Building a 4×4×4 cube of spheres...",
             font_size=24
         ).to_edge(DOWN)
         self.add_fixed_in_frame_mobjects(building_text)
         self.play(Write(building_text))
 
-        # Build the cube layer by layer
-        layers = []
-        for z in range(num_spheres_side):
-            layer = VGroup()
-            layer_spheres = []
-            for x in range(num_spheres_side):
-                for y in range(num_spheres_side):
-                    sphere = Sphere(
-                        radius=sphere_radius, 
-                        fill_opacity=0.8, 
-                        color=RED,
-                        resolution=(8, 8)  # Lower resolution for better performance
-                    ).shift(
-                        np.array([
-                            -cube_side/2 + (cube_side/(num_spheres_side-1))*x,
-                            -cube_side/2 + (cube_side/(num_spheres_side-1))*y,
-                            -cube_side/2 + (cube_side/(num_spheres_side-1))*z,
-                            ])
-                    )
-                    layer.add(sphere)
-                    layer_spheres.append(sphere)
-                    spheres.add(sphere)
-            
-            layers.append(layer)
+        # Build the whole cube as one glyph field, ordered layer by layer
+        coords = -cube_side/2 + (cube_side/(num_spheres_side-1)) * np.arange(num_spheres_side)
+        zs, xs, ys = np.meshgrid(coords, coords, coords, indexing="ij")
+        spheres = SphereGlyphField(
+            np.stack([xs.ravel(), ys.ravel(), zs.ravel()], axis=-1),
+            radii=sphere_radius,
+            colors=RED,
+            fill_opacity=0.8
+        )
+        layer_size = num_spheres_side ** 2
+        layers = [
+            spheres[i * layer_size:(i + 1) * layer_size]
+            for i in range(num_spheres_side)
+        ]
             
         # Animate adding layers
         layer_text = None
@@ -776,7 +863,7 @@ class CubeOfSpheres(ThreeDScene):
             if layer_text:
                 self.play(FadeOut(layer_text))
                 
-            layer_text = Text(
+            layer_text = cached_text(
                 f"Adding layer {i+1} of {num_spheres_side}",
                 font_size=24
             ).to_edge(DOWN)
@@ -784,7 +871,7 @@ class CubeOfSpheres(ThreeDScene):
             self.add_fixed_in_frame_mobjects(layer_text)
             
             self.play(
-                FadeOut(building_text if i == 0 else None),
+                *([FadeOut(building_text)] if i == 0 else []),
                 Write(layer_text),
                 FadeIn(layer),
                 run_time=1
@@ -793,7 +880,7 @@ class CubeOfSpheres(ThreeDScene):
         self.add(spheres)
         
         # Explain camera movement
-        camera_text = Text(
+        camera_text = cached_text(
             "Rotating the camera to view the cube from different angles",
             font_size=24
         ).to_edge(DOWN)
@@ -813,7 +900,7 @@ class CubeOfSpheres(ThreeDScene):
         
         self.wait(2)
         
-        conclusion_text = Text(
+        conclusion_text = cached_text(
             "This simple cube demonstrates basic 3D visualization techniques",
             font_size=24
         ).to_edge(DOWN)
@@ -0,0 +1,210 @@
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+from manim import *
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+# Set to 1 to stream frames straight into one encoder per section
+STREAMING_ENV = "MANIM_STREAMING"
+
+# Movie formats the encoder can stream into, gifs and pngs go the usual way
+STREAMING_FORMATS = ("mp4", "mov", "webm")
+
+
+class StreamingFileWriter(SceneFileWriter):
+    # Keeps one ffmpeg process open per section instead of one per play(), and
+    # feeds it from a thread so the next frame renders while the last one is
+    # encoded. There are no partial movie files, so play() caching is off
+    queue_size = 8
+
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.stream_files = []
+        self.stream_file = None
+        self.stream_process = None
+        self.frame_queue = None
+        self.encoder_thread = None
+        self.encoder_error = None
+
+    def is_streaming(self):
+        return config["write_to_movie"] and config["format"] in STREAMING_FORMATS
+
+    def get_encoder_command(self, file_path):
+        # Same encoder settings as SceneFileWriter.open_movie_pipe
+        fps = config["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+        command = [
+            "ffmpeg",
+            "-y",
+            "-f", "rawvideo",
+            "-s", f"{config['pixel_width']}x{config['pixel_height']}",
+            "-pix_fmt", "rgba",
+            "-r", str(fps),
+            "-i", "-",
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+        ]
+        if config["format"] == "webm":
+            command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+        elif config["transparent"]:
+            command += ["-vcodec", "qtrle"]
+        else:
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+        return command + [str(file_path)]
+
+    def open_stream(self):
+        self.stream_file = Path(
+            self.partial_movie_directory,
+            f"stream_{len(self.stream_files):04d}{config['movie_file_extension']}",
+        )
+        self.stream_process = subprocess.Popen(
+            self.get_encoder_command(self.stream_file), stdin=subprocess.PIPE
+        )
+        self.frame_queue = queue.Queue(maxsize=self.queue_size)
+        self.encoder_thread = threading.Thread(target=self._encode_frames, daemon=True)
+        self.encoder_thread.start()
+
+    def _encode_frames(self):
+        stdin = self.stream_process.stdin
+        while True:
+            frame_bytes = self.frame_queue.get()
+            if frame_bytes is None:
+                break
+            if self.encoder_error is not None:
+                continue
+            try:
+                stdin.write(frame_bytes)
+            except OSError as error:
+                # Keep draining so the render thread never blocks on a full queue
+                self.encoder_error = error
+
+    def close_stream(self):
+        if self.stream_process is None:
+            return
+        self.frame_queue.put(None)
+        self.encoder_thread.join()
+        self.stream_process.stdin.close()
+        self.stream_process.wait()
+        self.stream_files.append(self.stream_file)
+        self.stream_process = None
+        if self.encoder_error is not None:
+            raise RuntimeError(f"Encoder for {self.stream_file} failed") from self.encoder_error
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        if not self.is_streaming():
+            super().begin_animation(allow_write, file_path)
+
+    def end_animation(self, allow_write=False):
+        if not self.is_streaming():
+            super().end_animation(allow_write)
+
+    def write_frame(self, frame_or_renderer, num_frames=1):
+        # manim >= 0.19 passes held frames (wait, static scenes) once with
+        # num_frames, older versions call once per frame
+        if not self.is_streaming():
+            if num_frames == 1:
+                return super().write_frame(frame_or_renderer)
+            return super().write_frame(frame_or_renderer, num_frames=num_frames)
+        if self.encoder_error is not None:
+            raise RuntimeError(f"Encoder for {self.stream_file} failed") from self.encoder_error
+        if self.stream_process is None:
+            # Opened on the first frame, sections that are skipped get no file
+            self.open_stream()
+        # Copy now, the camera draws the next frame into the same array
+        frame_bytes = frame_or_renderer.tobytes()
+        for _ in range(num_frames):
+            self.frame_queue.put(frame_bytes)
+
+    def next_section(self, *args, **kwargs):
+        if self.is_streaming():
+            self.close_stream()
+        super().next_section(*args, **kwargs)
+
+    def finish(self):
+        if not self.is_streaming():
+            return super().finish()
+        self.close_stream()
+        if not self.stream_files:
+            return
+        if len(self.stream_files) == 1:
+            os.replace(self.stream_files[0], self.movie_file_path)
+        else:
+            self.concatenate_streams()
+        if self.includes_sound:
+            self.add_sound_track()
+        if config.save_sections:
+            logger.warning("Section videos are not written in streaming mode")
+        if self.subcaptions:
+            self.write_subcaption_file()
+        self.print_file_ready_message(self.movie_file_path)
+
+    def add_sound_track(self):
+        # The streams are encoded without audio, the scene's sounds are muxed
+        # into the finished movie the same way SceneFileWriter.combine_to_movie
+        # does it
+        movie_file_path = Path(self.movie_file_path)
+        sound_file_path = movie_file_path.with_suffix(".wav")
+        temporary_path = movie_file_path.with_name(f"{movie_file_path.stem}_temp{movie_file_path.suffix}")
+        # An empty segment at the current time pads the sound to the video
+        self.add_audio_segment(self.audio_segment[:0])
+        self.audio_segment.export(sound_file_path, bitrate="312k")
+        try:
+            subprocess.run([
+                "ffmpeg", "-y",
+                "-loglevel", config["ffmpeg_loglevel"].lower(),
+                "-i", str(movie_file_path),
+                "-i", str(sound_file_path),
+                "-c:v", "copy",
+                "-c:a", "aac", "-b:a", "320k",
+                str(temporary_path),
+            ], check=True)
+            os.replace(temporary_path, movie_file_path)
+        finally:
+            sound_file_path.unlink(missing_ok=True)
+
+    def concatenate_streams(self):
+        # All streams share one encoder setup, so they join without re-encoding
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file_list:
+            for stream_file in self.stream_files:
+                file_list.write(f"file '{Path(stream_file).resolve().as_posix()}'\n")
+        try:
+            subprocess.run([
+                "ffmpeg", "-y",
+                "-loglevel", config["ffmpeg_loglevel"].lower(),
+                "-f", "concat", "-safe", "0",
+                "-i", file_list.name,
+                "-c", "copy",
+                str(self.movie_file_path),
+            ], check=True)
+        finally:
+            os.unlink(file_list.name)
+        for stream_file in self.stream_files:
+            Path(stream_file).unlink()
+
+
+class StreamingSceneMixin:
+    # Renders through StreamingFileWriter when STREAMING_ENV is set. Mix in
+    # before the Scene class
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.streaming = bool(os.environ.get(STREAMING_ENV)) and isinstance(self.renderer, CairoRenderer)
+        if self.streaming:
+            self.renderer._file_writer_class = StreamingFileWriter
+            self.renderer.init_scene(self)
+
+    def render(self, preview=False):
+        # play() caching is only off for this render
+        if not self.streaming:
+            return super().render(preview)
+        disable_caching = config.disable_caching
+        config.disable_caching = True
+        try:
+            return super().render(preview)
+        finally:
+            config.disable_caching = disable_caching
@@ -0,0 +1,116 @@
+from manim import *
+import numpy as np
+
+from colormaps import to_rgb_array
+from glyphs import SphereGlyphField
+from meshes import POINTS_PER_CURVE, corners_to_bezier_points, grid_to_quads, mesh_to_polygons
+
+
+class MeshSurface(VGroup):
+    # Surface built straight from precomputed polygon faces, without a parametric
+    # function callback per vertex. faces has shape (n, k, 3), polygons that do
+    # not repeat their first corner are closed here; colors can be given per face
+    def __init__(
+        self,
+        faces,
+        colors=BLUE_D,
+        fill_opacity=1.0,
+        stroke_color=LIGHT_GREY,
+        stroke_width=0.5,
+        stroke_opacity=1.0,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        faces = self._close_faces(faces)
+        for face_points in corners_to_bezier_points(faces):
+            face = ThreeDVMobject()
+            face.set_points(face_points)
+            face.set_stroke(stroke_color, stroke_width, stroke_opacity)
+            self.add(face)
+        self.set_face_colors(colors, fill_opacity)
+
+    @classmethod
+    def from_grid(cls, grid, valid=None, **kwargs):
+        # grid is (rows, cols, 3). Points where valid is False are holes: every
+        # face touching them is dropped, so ragged rows keep all their own faces
+        quads = grid_to_quads(grid)
+        if valid is not None:
+            valid = np.asarray(valid, dtype=bool)
+            face_valid = valid[:-1, :-1] & valid[1:, :-1] & valid[1:, 1:] & valid[:-1, 1:]
+            quads = quads[face_valid]
+        return cls(quads.reshape(-1, 5, 3), **kwargs)
+
+    @classmethod
+    def from_mesh(cls, vertices, faces, **kwargs):
+        # Indexed mesh, e.g. one loaded from the geometry cache
+        return cls(mesh_to_polygons(vertices, faces), **kwargs)
+
+    @staticmethod
+    def _close_faces(faces):
+        faces = np.asarray(faces, dtype=float)
+        if len(faces) and not np.allclose(faces[:, 0], faces[:, -1]):
+            faces = np.concatenate([faces, faces[:, :1]], axis=1)
+        return faces
+
+    @property
+    def faces(self):
+        # (n, k, 3) closed corners, read back from the faces' points so that
+        # shift, rotate, apply_function and the like are always included
+        if not self.submobjects:
+            return np.zeros((0, 0, 3))
+        return np.array([
+            np.concatenate([face.points[::POINTS_PER_CURVE], face.points[-1:]])
+            for face in self.submobjects
+        ])
+
+    @property
+    def face_colors(self):
+        # (n, 3) fill colors, read back like the corners
+        if not self.submobjects:
+            return np.zeros((0, 3))
+        return np.array([face.fill_rgbas[0, :3] for face in self.submobjects])
+
+    def get_face_centers(self):
+        # Mean of the distinct corners. Faces padded to a common corner count
+        # repeat a corner, which would pull a plain mean towards it
+        corners = self.faces[:, :-1]
+        distinct = np.ones(corners.shape[:2], dtype=bool)
+        distinct[:, 1:] = (corners[:, 1:] != corners[:, :-1]).any(axis=-1)
+        return (corners * distinct[..., None]).sum(axis=1) / distinct.sum(axis=1, keepdims=True)
+
+    def set_faces(self, faces):
+        # Move every face at once, e.g. when interpolating between meshes
+        faces = self._close_faces(faces)
+        for face, face_points in zip(self.submobjects, corners_to_bezier_points(faces)):
+            face.set_points(face_points)
+        return self
+
+    def set_face_colors(self, colors, fill_opacity=None):
+        for face, rgb in zip(self.submobjects, to_rgb_array(colors, len(self.submobjects))):
+            face.set_fill(rgb_to_color(rgb), opacity=fill_opacity)
+        return self
+
+
+class PolyhedronMesh(VGroup):
+    # Lightweight stand-in for manim's Polyhedron: translucent faces plus a small
+    # sphere glyph on every vertex, built from an indexed mesh
+    def __init__(
+        self,
+        vertices,
+        faces,
+        color=BLUE,
+        fill_opacity=0.5,
+        vertex_radius=DEFAULT_DOT_RADIUS,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.faces = MeshSurface.from_mesh(
+            vertices,
+            faces,
+            colors=color,
+            fill_opacity=fill_opacity,
+            stroke_color=color,
+            stroke_width=DEFAULT_STROKE_WIDTH,
+        )
+        self.vertices = SphereGlyphField(vertices, radii=vertex_radius, colors=color)
+        self.add(self.faces, self.vertices)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The modules sit flat in the repository root and import each other as siblings
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from complex_sampling import sample_complex_adaptive, sample_complex_grid
+
+
+def get_face_areas(sample):
+    # Shoelace formula, the repeated padding corners add nothing
+    x, y = sample.x[sample.faces], sample.y[sample.faces]
+    return 0.5 * np.abs((x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y).sum(axis=1))
+
+
+@pytest.mark.parametrize("max_samples", [100, 300, 576])
+def test_respects_sample_budget(max_samples):
+    sample = sample_complex_adaptive(lambda z: np.exp(3 * z) * np.sin(5 * z), max_samples=max_samples)
+    # The last split may add a few vertices past the budget
+    assert max_samples <= len(sample.x) <= max_samples + 16
+
+
+def test_flat_function_stays_coarse():
+    sample = sample_complex_adaptive(lambda z: 1 + 0 * z, initial_cells=8)
+    assert len(sample.x) == 81
+    assert len(sample.faces) == 64
+    assert get_face_areas(sample).sum() == pytest.approx(36)
+
+
+def test_pole_is_invalid_and_refined():
+    sample = sample_complex_adaptive(lambda z: 1 / z)
+    pole = np.flatnonzero((sample.x == 0) & (sample.y == 0))
+    assert len(pole) == 1
+    assert not sample.valid[pole[0]]
+    assert np.count_nonzero(~sample.valid) == 1
+    assert pole[0] not in sample.faces
+    assert sample.cell_size[pole[0]] == sample.cell_size.min()
+    assert np.isnan(sample.magnitude[pole[0]]) and np.isnan(sample.phase[pole[0]])
+    assert np.isfinite(sample.colors[sample.valid]).all()
+
+
+def test_nan_region():
+    sample = sample_complex_adaptive(lambda z: np.where(z.real < 0, np.nan, z))
+    assert not sample.valid[sample.x < 0].any()
+    assert sample.valid[sample.x >= 0].all()
+    assert sample.valid[sample.faces].all()
+    # Only the right half-plane is covered
+    assert get_face_areas(sample).sum() == pytest.approx(18)
+
+
+def test_scalar_only_function():
+    def reciprocal(z):
+        if z == 0:
+            raise ZeroDivisionError
+        return 1 / z
+
+    sample = sample_complex_adaptive(reciprocal, max_samples=200)
+    assert np.count_nonzero(~sample.valid) == 1
+    assert np.allclose(sample.values[sample.valid], 1 / (sample.x + 1j * sample.y)[sample.valid])
+
+
+def test_grid_matches_pointwise_evaluation():
+    x_values = np.linspace(-2, 2, 200)
+    y_values = np.linspace(-1, 1, 100)
+    sample = sample_complex_grid(lambda z: np.exp(z) / z, x_values, y_values)
+    assert sample.values.shape == (200, 100)
+    assert sample.x[:, 0] == pytest.approx(x_values)
+    assert sample.y[0] == pytest.approx(y_values)
+    expected = np.exp(sample.x + 1j * sample.y) / (sample.x + 1j * sample.y)
+    assert sample.values == pytest.approx(expected)
+    assert sample.magnitude.max() <= 5
+    assert sample.colors.shape == (200, 100, 3)
+
+
+def test_grid_masks_invalid_values():
+    sample = sample_complex_grid(lambda z: 1 / z, [-1, 0, 1], [-1, 0, 1])
+    assert sample.valid.sum() == 8 and not sample.valid[1, 1]
+    assert np.isnan(sample.magnitude[1, 1]) and np.isnan(sample.phase[1, 1])
+    assert np.isnan(sample.colors[1, 1]).all()
+    assert np.isfinite(sample.colors[sample.valid]).all()
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from contour_integration import QUADRATURE_RULES, get_quadrature_rule, integrate_contour
+
+
+def reciprocal(z):
+    return 1 / z
+
+
+def circle_path(t):
+    # Unit circle, once counterclockwise for t in [0, 1]
+    z = np.exp(2j * np.pi * np.asarray(t, dtype=float))
+    return z, 2j * np.pi * z
+
+
+def rectangle_nodes(width, height, nodes_per_side):
+    corners = np.array([1 - 1j, 1 + 1j, -1 + 1j, -1 - 1j, 1 - 1j])
+    corners = width / 2 * corners.real + 1j * height / 2 * corners.imag
+    s = np.linspace(0, 1, nodes_per_side, endpoint=False)
+    sides = [start + s * (end - start) for start, end in zip(corners[:-1], corners[1:])]
+    return np.concatenate(sides + [corners[-1:]])
+
+
+@pytest.mark.parametrize("rule", QUADRATURE_RULES)
+def test_reciprocal_around_circle(rule):
+    t = np.linspace(0, 1, 129)
+    nodes = circle_path(t)[0]
+    result = integrate_contour(reciprocal, nodes, rule=rule, path=circle_path, t=t)
+    assert result.value == pytest.approx(2j * np.pi, abs=1e-8)
+    assert result.cumulative[0] == 0
+    assert result.cumulative[-1] == result.value
+    assert not result.singular_panels.any()
+
+
+@pytest.mark.parametrize("rule", ["simpson", "gauss"])
+def test_reciprocal_around_rectangle(rule):
+    nodes = rectangle_nodes(4, 2, 32)
+    result = integrate_contour(reciprocal, nodes, rule=rule)
+    assert result.value == pytest.approx(2j * np.pi, abs=1e-6)
+    assert result.error_estimate < 1e-6
+
+
+def test_contour_not_enclosing_pole():
+    nodes = rectangle_nodes(4, 2, 32) + 5
+    result = integrate_contour(reciprocal, nodes, rule="gauss")
+    assert result.value == pytest.approx(0, abs=1e-10)
+
+
+def test_pole_on_path_is_skipped():
+    # The polyline passes through 0, so the panel next to it is singular
+    nodes = np.concatenate([[-1 - 1j], np.linspace(-1, 1, 5) + 0j, [1 + 1j]])
+    result = integrate_contour(reciprocal, nodes, rule="trapezoid")
+    assert result.singular_panels.any()
+    assert np.isfinite(result.cumulative).all()
+
+
+def test_unknown_rule():
+    with pytest.raises(ValueError):
+        get_quadrature_rule("midpoint")
@@ -0,0 +1,44 @@
+import pytest
+
+# The camera draws real mobjects
+manim = pytest.importorskip("manim")
+
+from layered_camera import LayeredCamera, LayeredSceneMixin
+
+
+class LayeredScene(LayeredSceneMixin, manim.ThreeDScene):
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=LayeredCamera, **kwargs)
+
+
+def get_draw_order(scene, animations):
+    scene.renderer.camera.reset_rotation_matrix()
+    moving_mobjects, static_mobjects = scene.get_moving_and_static_mobjects(animations)
+    assert static_mobjects == []
+    return scene.renderer.camera.get_mobjects_to_display(moving_mobjects)
+
+
+@pytest.mark.parametrize("moving_first", [False, True])
+def test_static_and_moving_keep_scene_order(moving_first):
+    with manim.tempconfig({"pixel_width": 160, "pixel_height": 90}):
+        scene = LayeredScene()
+        static = manim.Square()
+        moving = manim.Dot()
+        scene.add(*([moving, static] if moving_first else [static, moving]))
+        order = get_draw_order(scene, [manim.Rotate(moving, manim.PI)])
+    assert (order.index(moving) < order.index(static)) == moving_first
+    assert moving in scene.renderer.camera.moving_mobjects
+    assert static not in scene.renderer.camera.moving_mobjects
+
+
+def test_only_shaded_mobjects_are_depth_sorted():
+    with manim.tempconfig({"pixel_width": 160, "pixel_height": 90}):
+        scene = LayeredScene()
+        plane = manim.Square()
+        near = manim.Square().set_shade_in_3d(True).shift(manim.OUT)
+        far = manim.Square().set_shade_in_3d(True).shift(manim.IN)
+        caption = manim.Dot()
+        scene.add(near, plane, far, caption)
+        order = get_draw_order(scene, [manim.Rotate(caption, manim.PI)])
+    # The shaded squares swap places, the flat ones stay where the scene put them
+    assert order == [far, plane, near, caption]
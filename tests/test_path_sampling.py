@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from path_sampling import BezierPathSampler, sample_path
+
+# Control point distance that makes a cubic Bezier follow a quarter circle
+QUARTER_CIRCLE_HANDLE = 4 / 3 * (np.sqrt(2) - 1)
+
+
+def circle_points(radius):
+    points = []
+    for quarter in range(4):
+        start, end = quarter * np.pi / 2, (quarter + 1) * np.pi / 2
+        p0 = np.array([np.cos(start), np.sin(start), 0])
+        p3 = np.array([np.cos(end), np.sin(end), 0])
+        p1 = p0 + QUARTER_CIRCLE_HANDLE * np.array([-np.sin(start), np.cos(start), 0])
+        p2 = p3 - QUARTER_CIRCLE_HANDLE * np.array([-np.sin(end), np.cos(end), 0])
+        points += [p0, p1, p2, p3]
+    return radius * np.array(points)
+
+
+def polyline_points(corners):
+    # Straight cubic curves between the corners, like set_points_as_corners
+    corners = np.asarray(corners, dtype=float)
+    start, end = corners[:-1], corners[1:]
+    return np.stack([start, start + (end - start) / 3, start + 2 * (end - start) / 3, end], axis=1).reshape(-1, 3)
+
+
+SQUARE_CORNERS = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [0, 0, 0]]
+
+
+def test_circle_length():
+    sampler = BezierPathSampler(circle_points(1.5))
+    assert sampler.length == pytest.approx(2 * np.pi * 1.5, rel=1e-3)
+
+
+def test_samples_are_evenly_spaced():
+    sample = BezierPathSampler(circle_points(1.5)).sample(101)
+    spacing = np.abs(np.diff(sample.z))
+    assert spacing == pytest.approx(np.full(100, spacing.mean()), rel=1e-4)
+    assert np.abs(sample.dz_dt) == pytest.approx(np.full(101, 2 * np.pi * 1.5), rel=1e-3)
+
+
+def test_square_corners():
+    sampler = BezierPathSampler(polyline_points(SQUARE_CORNERS))
+    assert sampler.length == pytest.approx(8)
+    assert sampler.get_corner_parameters() == pytest.approx([0.25, 0.5, 0.75])
+
+
+def test_square_sample_includes_corners():
+    sample = sample_path(polyline_points(SQUARE_CORNERS), 6, include_corners=True)
+    for corner in ([2, 0, 0], [2, 2, 0], [0, 2, 0]):
+        assert np.linalg.norm(sample.points - corner, axis=1).min() < 1e-9
+    assert np.all(np.diff(sample.t) > 0)
+
+
+def test_circle_has_no_corners():
+    assert len(BezierPathSampler(circle_points(1)).get_corner_parameters()) == 0
@@ -0,0 +1,44 @@
+import pytest
+
+# Fingerprints are taken of real scenes and cameras
+manim = pytest.importorskip("manim")
+
+from render_cache import FingerprintCacheMixin
+
+
+class FingerprintScene(FingerprintCacheMixin, manim.ThreeDScene):
+    pass
+
+
+def get_key(*mobjects, **camera_settings):
+    with manim.tempconfig({"pixel_width": 160, "pixel_height": 90}):
+        scene = FingerprintScene()
+        camera = scene.renderer.camera
+        for name, value in camera_settings.items():
+            setattr(camera, name, value)
+        scene.add(*mobjects)
+        animations = [manim.Wait()]
+        return scene.get_play_fingerprint(scene, camera, animations, scene.mobjects)
+
+
+def test_same_frames_same_key():
+    assert get_key(manim.Square(color=manim.RED)) == get_key(manim.Square(color=manim.RED))
+
+
+def test_different_mobjects_different_keys():
+    assert get_key(manim.Square(color=manim.RED)) != get_key(manim.Square(color=manim.BLUE))
+    assert get_key(manim.Square()) != get_key(manim.Square().shift(manim.RIGHT))
+
+
+def test_different_text_different_keys():
+    # become() leaves the points of the other text but not its content
+    a = manim.Text("a")
+    b = manim.Text("b").become(a)
+    assert get_key(a) != get_key(b)
+
+
+def test_camera_state_changes_key():
+    square = manim.Square().set_shade_in_3d(True)
+    assert get_key(square) != get_key(square, exponential_projection=True)
+    light_source = manim.Point(manim.ORIGIN)
+    assert get_key(square) != get_key(square, light_source=light_source)
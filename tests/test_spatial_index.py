@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from spatial_index import GridIndex
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(0).uniform(-3, 3, size=(500, 3))
+
+
+@pytest.mark.parametrize("radius", [0.1, 0.5, 2.0])
+def test_query_radius_matches_brute_force(points, radius):
+    index = GridIndex(points)
+    for query in np.random.default_rng(1).uniform(-4, 4, size=(50, 3)):
+        distances = np.linalg.norm(points - query, axis=1)
+        found = index.query_radius(query, radius)
+        assert set(found.tolist()) == set(np.flatnonzero(distances <= radius).tolist())
+        assert np.all(np.diff(distances[found]) >= 0)
+
+
+def test_nearest_matches_brute_force(points):
+    index = GridIndex(points, cell_size=0.25)
+    for query in np.random.default_rng(2).uniform(-10, 10, size=(50, 3)):
+        distances = np.linalg.norm(points - query, axis=1)
+        assert index.nearest(query) == np.argmin(distances)
+
+
+def test_nearest_max_distance(points):
+    index = GridIndex(points)
+    assert index.nearest([20, 20, 20], max_distance=1) is None
+
+
+def test_empty_index():
+    index = GridIndex(np.zeros((0, 3)))
+    assert len(index) == 0
+    assert index.nearest([0, 0, 0]) is None
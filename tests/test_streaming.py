@@ -0,0 +1,48 @@
+import shutil
+import subprocess
+
+import pytest
+
+# Renders a real scene, so it needs manim and ffmpeg
+manim = pytest.importorskip("manim")
+if shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None:
+    pytest.skip("ffmpeg is not installed", allow_module_level=True)
+
+from streaming import STREAMING_ENV, StreamingFileWriter, StreamingSceneMixin
+
+
+class ShortScene(StreamingSceneMixin, manim.Scene):
+    def construct(self):
+        self.play(manim.Create(manim.Square()), run_time=0.5)
+        # A held frame, passed to the writer once with num_frames
+        self.wait(0.5)
+
+
+def count_frames(movie):
+    result = subprocess.run([
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-count_packets",
+        "-show_entries", "stream=nb_read_packets",
+        "-of", "csv=p=0",
+        str(movie),
+    ], capture_output=True, text=True, check=True)
+    return int(result.stdout.strip())
+
+
+def test_streamed_render(tmp_path, monkeypatch):
+    monkeypatch.setenv(STREAMING_ENV, "1")
+    options = {
+        "media_dir": str(tmp_path),
+        "pixel_width": 160,
+        "pixel_height": 90,
+        "frame_rate": 10,
+        "write_to_movie": True,
+        "disable_caching": True,
+    }
+    with manim.tempconfig(options):
+        scene = ShortScene()
+        assert isinstance(scene.renderer.file_writer, StreamingFileWriter)
+        scene.render()
+        movie = scene.renderer.file_writer.movie_file_path
+    assert count_frames(movie) == 10
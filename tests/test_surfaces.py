@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+# MeshSurface is a manim VGroup
+manim = pytest.importorskip("manim")
+
+from surfaces import MeshSurface
+
+SQUARE = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+# Padded to five corners by repeating the last one
+TRIANGLE = [[2, 0, 0], [3, 0, 0], [2, 1, 0], [2, 1, 0]]
+
+
+def test_faces_follow_moves():
+    surface = MeshSurface([SQUARE, TRIANGLE], colors=manim.RED)
+    assert surface.faces.shape == (2, 5, 3)
+    surface.shift(manim.OUT)
+    assert surface.faces[0, :4] == pytest.approx(np.array(SQUARE) + manim.OUT)
+    surface.rotate(manim.PI, about_point=manim.ORIGIN)
+    assert surface.faces[1, :4] == pytest.approx(-(np.array(TRIANGLE) + manim.OUT) * [1, 1, -1])
+    assert surface.get_face_centers()[0] == pytest.approx([-0.5, -0.5, 1])
+
+
+def test_face_colors_follow_fill():
+    surface = MeshSurface([SQUARE, TRIANGLE], colors=manim.RED)
+    surface.set_fill(manim.BLUE)
+    assert surface.face_colors == pytest.approx(np.tile(manim.color_to_rgb(manim.BLUE), (2, 1)))
@@ -0,0 +1,131 @@
+import hashlib
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from manim import *
+from manim.utils.tex_file_writing import tex_hash
+
+try:
+    from manim.utils.tex_file_writing import make_tex_compilation_command
+except ImportError:
+    # manim < 0.19 builds the same command as one shell string ending in a
+    # "> /dev/null" redirect, which is dropped here
+    from manim.utils.tex_file_writing import tex_compilation_command
+
+    def make_tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
+        command = shlex.split(tex_compilation_command(
+            tex_compiler, output_format, tex_file.as_posix(), tex_dir.as_posix()
+        ))
+        return command[:command.index(">")] if ">" in command else command
+
+# Every character a DecimalNumber can typeset (it builds one MathTex per
+# character, complex values look like "1.23-4.56i")
+DECIMAL_TEX_CHARACTERS = tuple("0123456789.-+i")
+
+# Only used for its expression clean-up, so batched pages hash exactly like
+# the expressions MathTex compiles itself
+_EXPRESSION_MODIFIER = SingleStringMathTex.__new__(SingleStringMathTex)
+
+
+def get_tex_code(expression, environment="align*", tex_template=None):
+    # Full document manim would compile for MathTex(expression). Its hash is
+    # the name manim looks the SVG up under in tex_dir
+    tex_template = tex_template or config["tex_template"]
+    expression = _EXPRESSION_MODIFIER._get_modified_expression(expression)
+    return tex_template.get_texcode_for_expression_in_env(expression, environment)
+
+
+def _batch_document(tex_codes, tex_template):
+    # One document with every expression on its own page. The standalone
+    # class can only make one page, so switch to article without page numbers
+    head, tail = tex_template.body.split(tex_template.placeholder_text, 1)
+    pages = [code[len(head):len(code) - len(tail)] for code in tex_codes]
+    head = re.sub(r"\\documentclass(\[[^\]]*\])?\{standalone\}", r"\\documentclass{article}", head)
+    return head + "\n\\newpage\n".join(
+        "\\thispagestyle{empty}\n" + page for page in pages
+    ) + tail
+
+
+def compile_tex_batch(expressions, environment="align*", tex_template=None):
+    # Compile every expression that is not in the tex cache yet with a single
+    # LaTeX run and a single dvisvgm run, then file each page under the name
+    # MathTex would look for. Returns the number of expressions compiled.
+    # Anything that fails is left for MathTex to compile (and report) itself
+    tex_template = tex_template or config["tex_template"]
+    tex_dir = Path(config.get_dir("tex_dir"))
+    tex_dir.mkdir(parents=True, exist_ok=True)
+
+    svg_files = {}
+    for expression in expressions:
+        tex_code = get_tex_code(expression, environment, tex_template)
+        svg_file = tex_dir / f"{tex_hash(tex_code)}.svg"
+        if not svg_file.exists():
+            svg_files[tex_code] = svg_file
+    if not svg_files:
+        return 0
+
+    document = _batch_document(list(svg_files), tex_template)
+    name = "batch_" + hashlib.sha256(document.encode()).hexdigest()[:16]
+    # Each process compiles in a directory of its own, parallel renders of
+    # the same scene would otherwise share (and clean up) the batch files
+    build_dir = Path(tempfile.mkdtemp(prefix=f"{name}_", dir=tex_dir))
+    tex_file = build_dir / f"{name}.tex"
+    tex_file.write_text(document, encoding="utf-8")
+
+    output_format = tex_template.output_format
+    output_file = tex_file.with_suffix(output_format)
+    command = make_tex_compilation_command(
+        tex_template.tex_compiler,
+        output_format,
+        tex_file,
+        build_dir,
+    )
+    subprocess.run(command, stdout=subprocess.DEVNULL)
+    compiled = 0
+    if output_file.exists():
+        subprocess.run([
+            "dvisvgm",
+            *(["--pdf"] if output_format == ".pdf" else []),
+            "--page=1-",
+            "-n",
+            "-v", "0",
+            "-o", (build_dir / f"{name}-%p.svg").as_posix(),
+            output_file.as_posix(),
+        ])
+
+        # Pages come back as <name>-<page>.svg, in document order. Renaming
+        # within tex_dir is atomic, so readers never see a partial SVG
+        pages = {
+            int(path.stem.rsplit("-", 1)[1]): path
+            for path in build_dir.glob(f"{name}-*.svg")
+        }
+        for page, svg_file in enumerate(svg_files.values(), start=1):
+            if page in pages:
+                os.replace(pages[page], svg_file)
+                compiled += 1
+    else:
+        logger.warning(f"Batched LaTeX run failed, see {tex_file.with_suffix('.log')}")
+
+    if compiled and not config["no_latex_cleanup"]:
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return compiled
+
+
+class TexBatchMixin:
+    # Compiles every TeX string the scene will need in one go before construct
+    # runs, instead of one LaTeX + dvisvgm launch per MathTex. Scenes list their
+    # strings in get_tex_strings. Mix in before the Scene class
+    def get_tex_strings(self):
+        return []
+
+    def setup(self):
+        super().setup()
+        expressions = list(dict.fromkeys(self.get_tex_strings()))
+        if expressions:
+            compiled = compile_tex_batch(expressions)
+            logger.info(f"Batched LaTeX: {compiled} of {len(expressions)} expressions compiled")
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+from manim import *
+
+
+class TextFactory:
+    # Hands out copies of already typeset Text/MathTex mobjects, keyed on the
+    # string and the options that change the glyphs (font, size, color, ...).
+    # Copying points is far cheaper than another Pango/LaTeX run plus SVG parse
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.prototypes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, mobject_class, args, kwargs):
+        try:
+            key = (
+                mobject_class.__name__,
+                args,
+                tuple(sorted((name, str(value)) for name, value in kwargs.items())),
+            )
+            hash(key)
+        except TypeError:
+            # Unhashable options, just build it
+            self.misses += 1
+            return mobject_class(*args, **kwargs)
+
+        prototype = self.prototypes.get(key)
+        if prototype is None:
+            self.misses += 1
+            prototype = mobject_class(*args, **kwargs)
+            self.prototypes[key] = prototype
+            if len(self.prototypes) > self.max_entries:
+                self.prototypes.popitem(last=False)
+        else:
+            self.hits += 1
+            self.prototypes.move_to_end(key)
+        return prototype.copy()
+
+    def text(self, text, **kwargs):
+        return self._get(Text, (text,), kwargs)
+
+    def math_tex(self, *tex_strings, **kwargs):
+        return self._get(MathTex, tex_strings, kwargs)
+
+    def clear(self):
+        self.prototypes.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.prototypes),
+        }
+
+    def describe(self):
+        stats = self.get_stats()
+        return (
+            f"Text cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} reused), {stats['entries']} entries"
+        )
+
+
+# Shared factory for the scenes in this repo
+TEXT_CACHE = TextFactory()
+cached_text = TEXT_CACHE.text
+cached_math_tex = TEXT_CACHE.math_tex